@@ -0,0 +1,117 @@
+"""
+Updater mit erklärten Abhängigkeiten.
+
+Ein gewöhnlicher Updater läuft in jedem Frame jedes play(), auch wenn sich nichts geändert hat,
+und macht sein Mobject - und alles, was in der Szene danach kommt - für Manim zu einem bewegten
+Mobject, das jeden Frame neu gerastert wird. when_changed erklärt, wovon ein Updater abhängt:
+
+    readout.add_updater(when_changed(lambda m: m.set_degrees(m.get_degrees()), phi_tracker))
+    p1.add_updater(when_changed(lambda m: m.move_to(trail.get_joint(1)), t))
+    label.add_updater(when_changed(lambda m: m.next_to(p1, UP), p1))      # Kette t -> p1 -> label
+    arrow.add_updater(when_changed(lambda m: m.put_start_and_end_on(...), p1.get_center))
+
+Abhängigkeiten: ValueTracker (Wert), Mobject (Punkte, Farben, Strichbreiten der Familie) oder
+eine Funktion ohne Argumente (Rückgabewert). Der Updater läuft nur, wenn sich seit seinem letzten
+Lauf eine Abhängigkeit geändert hat. LessonScene.get_moving_mobjects nutzt dieselben Angaben, um
+Mobjects mit solchen Updatern im statischen Bild zu lassen - nur wenn sicher nichts sie ändert,
+siehe updating_mobjects. ValueTracker dafür mit self.add(tracker) zur Szene hinzufügen.
+Nur für Updater ohne dt.
+"""
+import inspect
+
+import numpy as np
+from manim import Mobject, ValueTracker
+from manim.utils.family import extract_mobject_family_members
+
+from kamera import mobject_fingerprint
+
+
+def _value(dep):
+    if isinstance(dep, ValueTracker):
+        return dep.get_value()
+    if isinstance(dep, Mobject):
+        return mobject_fingerprint([dep])
+    value = dep()
+    return value.copy() if isinstance(value, np.ndarray) else value
+
+
+def _same(a, b):
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    return a == b
+
+
+def _owner(dep):
+    """Mobject hinter einer Abhängigkeit (bei gebundenen Methoden wie p1.get_center), sonst None."""
+    if isinstance(dep, Mobject):
+        return dep
+    owner = getattr(dep, "__self__", None)
+    return owner if isinstance(owner, Mobject) else None
+
+
+class DependentUpdater:
+    """Updater, der nur läuft, wenn sich eine seiner Abhängigkeiten geändert hat."""
+
+    def __init__(self, update, deps):
+        if "dt" in inspect.signature(update).parameters:
+            raise ValueError("when_changed: nur Updater ohne dt")
+        self.update = update
+        self.deps = deps
+        self.state = None
+        self.runs = 0
+        self.skips = 0
+
+    def snapshot(self):
+        return [_value(d) for d in self.deps]
+
+    def is_dirty(self):
+        return self.state is None or not all(map(_same, self.snapshot(), self.state))
+
+    def __call__(self, mobject):
+        if not self.is_dirty():
+            self.skips += 1
+            return
+        self.update(mobject)
+        self.runs += 1
+        self.state = self.snapshot()
+
+
+def when_changed(update, *deps):
+    """Updater update(m), der nur bei Änderung einer der Abhängigkeiten deps läuft."""
+    if not deps:
+        raise ValueError("when_changed: mindestens eine Abhängigkeit angeben")
+    return DependentUpdater(update, deps)
+
+
+def updating_mobjects(mobjects, animation_mobjects):
+    """
+    ids der Mobjects, deren Updater im kommenden play() etwas ändern können. Ein Mobject, das nur
+    DependentUpdater hat, gilt als ruhend, wenn
+      - keiner seiner Updater schon eine Änderung vorliegen hat (is_dirty),
+      - jede Abhängigkeit zu einem Mobject in mobjects gehört (Funktionen ohne Mobject dahinter
+        und Tracker außerhalb der Szene können sich unbemerkt ändern),
+      - keine Abhängigkeit zur Familie der animierten Mobjects gehört,
+      - und in diesem play() sonst kein Updater läuft: ein laufender Updater kann jede
+        Abhängigkeit verändern (z.B. einen Tracker setzen).
+    Alle anderen Mobjects mit Updatern zählen als bewegt.
+    """
+    scene_ids = {id(m) for m in mobjects}
+    animated = {id(m) for m in extract_mobject_family_members(animation_mobjects)}
+    pending = []
+    updating = set()
+    for mob in mobjects:
+        updaters = mob.get_family_updaters()
+        if not updaters:
+            continue
+        if all(isinstance(u, DependentUpdater) for u in updaters) and not any(u.is_dirty() for u in updaters):
+            pending.append((mob, updaters))
+        else:
+            updating.add(id(mob))
+
+    for mob, updaters in pending:
+        owners = [_owner(d) for u in updaters for d in u.deps]
+        if any(o is None or id(o) not in scene_ids or id(o) in animated for o in owners):
+            updating.add(id(mob))
+    if updating:
+        updating.update(id(mob) for mob, _ in pending)
+    return updating
@@ -0,0 +1,139 @@
+"""
+Aufgabengenerator "Bildpunkt bei Drehung berechnen" (wie VektorenV6, Teil 4).
+
+Erzeugt viele Aufgaben (Z, P, φ) auf einmal aus einem Seed, löst alle vektorisiert mit
+    OP' = OZ + R(φ)·ZP
+und schreibt Aufgabenblatt und Lösungsschlüssel als CSV. Ohne Manim lauffähig:
+
+    python aufgaben.py -n 2000 --seed 7 --stufe schwer -o media/aufgaben/klasse_8b
+    python aufgaben.py -n 3 --seed 7 --render -q l        # die ersten Aufgaben als Video (VektorenAufgabe)
+"""
+import argparse
+import csv
+import json
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from geometrie import rotate_points
+
+HERE = Path(__file__).resolve().parent
+TASK_ENV = "AUFGABE"
+
+# Schwierigkeitsstufen
+STUFEN = {
+    "leicht": dict(angles=(180,), center_at_origin=True),
+    "mittel": dict(angles=(90, -90, 180), center_at_origin=True),
+    "schwer": dict(angles=(90, -90, 180, 270), center_at_origin=False),
+}
+# sichtbarer Bereich des Koordinatensystems in den Szenen
+PLANE_BOUNDS = ((-6, 6), (-3, 4))
+
+
+def solve(Z, P, phi):
+    """Vektoriell: ZP, ZP' = R(φ)·ZP und P' = OZ + ZP' für Arrays (N,2), (N,2), (N,) [Grad]."""
+    Z = np.asarray(Z, dtype=float)
+    P = np.asarray(P, dtype=float)
+    P_img = rotate_points(P, np.radians(phi), about=Z)
+    return P - Z, P_img - Z, P_img
+
+
+def generate_tasks(n, seed=0, angles=(90, -90, 180), center_at_origin=False, integer_results=True,
+                   coord_range=(-4, 4), bounds=PLANE_BOUNDS, max_rounds=100):
+    """
+    n Aufgaben mit ganzzahligen Z, P und φ aus `angles` (Grad).
+    integer_results: nur Aufgaben mit ganzzahligem P' (bei Vierteldrehungen immer erfüllt)
+    bounds: P und P' müssen im sichtbaren Bereich liegen
+    Rückgabe: dict mit Arrays Z, P, phi, ZP, ZP_img, P_img
+    """
+    rng = np.random.default_rng(seed)
+    lo, hi = coord_range
+    (x0, x1), (y0, y1) = bounds
+    found = []
+    count = 0
+    for _ in range(max_rounds):
+        m = 2 * (n - count) + 16
+        Z = np.zeros((m, 2)) if center_at_origin else rng.integers(lo, hi + 1, size=(m, 2)).astype(float)
+        P = rng.integers(lo, hi + 1, size=(m, 2)).astype(float)
+        phi = rng.choice(np.asarray(angles, dtype=float), size=m)
+        ZP, ZP_img, P_img = solve(Z, P, phi)
+
+        ok = np.any(P != Z, axis=1)
+        for pts in (P, P_img):
+            ok &= (pts[:, 0] >= x0) & (pts[:, 0] <= x1) & (pts[:, 1] >= y0) & (pts[:, 1] <= y1)
+        if integer_results:
+            ok &= np.all(np.abs(P_img - np.round(P_img)) < 1e-9, axis=1)
+            P_img, ZP_img = np.round(P_img), np.round(ZP_img)
+        found.append((Z[ok], P[ok], phi[ok], ZP[ok], ZP_img[ok], P_img[ok]))
+        count += int(ok.sum())
+        if count >= n:
+            break
+    else:
+        raise ValueError(f"nur {count} von {n} Aufgaben erfüllen die Bedingungen")
+
+    keys = ["Z", "P", "phi", "ZP", "ZP_img", "P_img"]
+    return {k: np.concatenate([f[i] for f in found])[:n] for i, k in enumerate(keys)}
+
+
+def fmt(x):
+    x = round(float(x), 2)
+    return str(int(x)) if x == int(x) else f"{x:g}".replace(".", ",")
+
+
+def point(p):
+    return f"({fmt(p[0])}|{fmt(p[1])})"
+
+
+def write_sheets(tasks, out):
+    """Aufgabenblatt und Lösungsschlüssel als CSV (out_aufgaben.csv, out_loesungen.csv)."""
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    n = len(tasks["phi"])
+    with open(f"{out}_aufgaben.csv", "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f, delimiter=";")
+        w.writerow(["Nr", "Z", "P", "φ"])
+        for i in range(n):
+            w.writerow([i + 1, point(tasks["Z"][i]), point(tasks["P"][i]), f"{fmt(tasks['phi'][i])}°"])
+    with open(f"{out}_loesungen.csv", "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f, delimiter=";")
+        w.writerow(["Nr", "Z", "P", "φ", "ZP", "ZP'", "P'"])
+        for i in range(n):
+            w.writerow([i + 1, point(tasks["Z"][i]), point(tasks["P"][i]), f"{fmt(tasks['phi'][i])}°",
+                        point(tasks["ZP"][i]), point(tasks["ZP_img"][i]), point(tasks["P_img"][i])])
+
+
+def task_env(tasks, i):
+    """Aufgabe i als Wert für die Umgebungsvariable AUFGABE (gelesen von VektorenAufgabe)."""
+    return json.dumps({"Z": tasks["Z"][i].tolist(), "P": tasks["P"][i].tolist(), "phi": float(tasks["phi"][i])})
+
+
+def render_tasks(tasks, count, quality="l", out_dir=HERE / "media" / "aufgaben", workers=None):
+    """Rendert die ersten count Aufgaben parallel als Videos der Szene VektorenAufgabe."""
+    def run(i):
+        env = dict(os.environ, **{TASK_ENV: task_env(tasks, i)})
+        cmd = ["manim", "render", f"-q{quality}", "--media_dir", str(out_dir / f"{i + 1:04d}"),
+               "-o", f"Aufgabe_{i + 1:04d}", str(HERE / "vektoren.py"), "VektorenAufgabe"]
+        subprocess.run(cmd, cwd=HERE, env=env, check=True, stdout=subprocess.DEVNULL)
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        list(pool.map(run, range(count)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stufe", choices=STUFEN, default="schwer")
+    parser.add_argument("-o", "--out", default=str(HERE / "media" / "aufgaben" / "aufgaben"))
+    parser.add_argument("--render", type=int, nargs="?", const=3, default=0, help="erste Aufgaben als Video")
+    parser.add_argument("-q", "--quality", default="l", choices="lmhpk")
+    args = parser.parse_args()
+
+    tasks = generate_tasks(args.n, seed=args.seed, **STUFEN[args.stufe])
+    write_sheets(tasks, args.out)
+    print(f"{len(tasks['phi'])} Aufgaben -> {args.out}_aufgaben.csv / _loesungen.csv")
+    if args.render:
+        render_tasks(tasks, min(args.render, len(tasks["phi"])), args.quality)
@@ -0,0 +1,199 @@
+"""
+Streaming-Ausgabe: alle Frames einer Szene gehen direkt in einen einzigen ffmpeg-Prozess.
+
+Manim schreibt sonst für jedes play/wait ein eigenes Teilvideo und hängt sie am Ende
+aneinander (DrehungenV5: weit über hundert Dateien). Hier bleibt ein Encoder für die ganze
+Szene offen; die Kamera-Pixel werden ohne Kopie in die Pipe geschrieben. Unveränderte
+Frames (Pausen) rastert LessonRenderer nur einmal und wiederholt den Puffer.
+
+Statt der Teilvideos gibt es einen Index <Video>.plays.json: je play der Manim-Hash und der
+Bereich im Rohdatenstrom (erster Frame, Anzahl, Byte-Offset = Frame * Bytes pro Frame).
+Überspringt Manim beim nächsten Lauf ein play, weil sein Hash im Index steht, werden seine
+Frames aus dem vorigen Video dekodiert statt neu gerastert. Diese Frames sind damit ein zweites
+Mal H.264-kodiert (verlustbehaftet): jeder inkrementelle Lauf kostet sie etwas Bildqualität, das
+Ergebnis gleicht also nicht genau einem frischen Render. Für die endgültige Fassung ohne Wieder-
+verwendung rendern (--disable_caching oder <Video>.plays.json löschen).
+
+Eingeschaltet mit LEKTION_STREAM=1 (render_parallel.render_section setzt das, damit auch render_kurs.py).
+Nur für .mp4 ohne Transparenz; sonst bleibt es bei Manims Teilvideos.
+"""
+import json
+import os
+import subprocess
+
+import numpy as np
+from manim import __version__, config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import write_to_movie
+
+from kamera import mobject_fingerprint
+
+STREAM_ENV = "LEKTION_STREAM"
+
+
+def streaming_enabled():
+    if not os.environ.get(STREAM_ENV):
+        return False
+    # StreamingFileWriter ersetzt SceneFileWriter-Interna von Manim CE 0.18 (config.ffmpeg_executable,
+    # write_frame ohne num_frames); siehe requirements.txt
+    if not __version__.startswith("0.18."):
+        raise RuntimeError(f"{STREAM_ENV}: die Streaming-Ausgabe braucht Manim CE 0.18.x, installiert ist {__version__}")
+    return config.movie_file_extension == ".mp4" and not config.transparent
+
+
+class LessonRenderer(CairoRenderer):
+    """
+    Cairo-Renderer der Lektionsszenen.
+    - Standbild-Erkennung: ändert sich zwischen zwei Frames keines der bewegten Mobjects
+      (Prüfsumme über Punkte, Farben, Strichbreiten und Kamera-Ausschnitt), wird nicht neu
+      gerastert, sondern das letzte Bild wiederholt. Das greift auch dort, wo Manim selbst
+      nicht einfriert: wait() mit Szenen-Updatern oder Updatern, die nichts verändern, und
+      ruhende Strecken innerhalb von play() (lag_ratio, Succession mit Wait, Pausen der rate_func).
+    - Der Pixelpuffer der Kamera geht ohne Kopie an den FileWriter.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hold_key = None
+        self.held_frames = 0
+
+    def update_frame(self, scene, mobjects=None, *args, **kwargs):
+        self.hold_key = None  # Puffer neu gezeichnet (auch bei Standbild/Checkpoint/statischem Hintergrund)
+        super().update_frame(scene, mobjects, *args, **kwargs)
+
+    def frame_key(self, moving_mobjects):
+        c = self.camera
+        return (tuple(map(id, moving_mobjects)), tuple(c.frame_center), c.frame_width, c.frame_height,
+                mobject_fingerprint(moving_mobjects))
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            return
+        key = self.frame_key(moving_mobjects)
+        if key == self.hold_key:
+            self.held_frames += 1
+        else:
+            self.update_frame(scene, moving_mobjects)
+            self.hold_key = key
+        self.add_frame(self.camera.pixel_array)
+
+    def freeze_current_frame(self, duration):
+        # wie Manim (statisches wait), aber ohne Kopie des Bildes
+        num_frames = int(duration / (1 / self.camera.frame_rate))
+        self.held_frames += max(num_frames - 1, 0)
+        self.add_frame(self.camera.pixel_array, num_frames=num_frames)
+
+
+class StreamingFileWriter(SceneFileWriter):
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.writing_process = None
+        self.frames_written = 0
+        self.plays = []
+        self.reused = 0
+        self.cached_hash = None  # von is_already_cached bestätigt, Manim überspringt dieses play
+        use_previous = write_to_movie() and not config.dry_run and not config.disable_caching
+        self.previous = self.load_previous_index() if use_previous else {}
+
+    # --- Index ---
+    @property
+    def index_path(self):
+        return self.movie_file_path.with_suffix(".plays.json")
+
+    @property
+    def frame_bytes(self):
+        return config.pixel_width * config.pixel_height * 4
+
+    def load_previous_index(self):
+        try:
+            index = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        same_format = (index.get("width"), index.get("height"), index.get("fps")) == \
+                      (config.pixel_width, config.pixel_height, config.frame_rate)
+        if not same_format or not self.movie_file_path.exists():
+            return {}
+        # uncached_<n> (--disable_caching) zählt nur die plays durch und sagt nichts über den Inhalt
+        return {p["hash"]: p for p in index["plays"]
+                if p["hash"] and not p["hash"].startswith("uncached_") and p["frames"]}
+
+    def is_already_cached(self, hash_invocation):
+        cached = hash_invocation in self.previous
+        self.cached_hash = hash_invocation if cached else None
+        return cached
+
+    def add_partial_movie_file(self, hash_animation):
+        if not write_to_movie() or config.dry_run:
+            return
+        self.plays.append({"hash": hash_animation, "start": self.frames_written, "frames": 0})
+        # nur übernehmen, wenn Manim das play wegen des Treffers übersprungen hat - sonst
+        # kommen die frisch gerasterten Frames ohnehin
+        if hash_animation is not None and hash_animation == self.cached_hash:
+            self.copy_previous_frames(self.previous[hash_animation])
+            self.reused += 1
+        self.cached_hash = None
+
+    def copy_previous_frames(self, play):
+        """
+        Frames eines unveränderten play aus dem vorigen Video dekodieren und weiterreichen.
+        Sie werden erneut (verlustbehaftet) kodiert, siehe oben.
+        """
+        self.open_stream()
+        cmd = [config.ffmpeg_executable, "-loglevel", "error", "-ss", f"{play['start'] / config.frame_rate:.6f}",
+               "-i", str(self.movie_file_path), "-frames:v", str(play["frames"]),
+               "-f", "rawvideo", "-pix_fmt", "rgba", "-"]
+        decoder = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+        buffer = np.empty(self.frame_bytes, dtype=np.uint8)
+        while decoder.stdout.readinto(buffer) == self.frame_bytes:
+            self.write_frame(buffer)
+        decoder.wait()
+
+    # --- Encoder ---
+    def open_stream(self):
+        if self.writing_process is not None:
+            return
+        self.stream_path = self.movie_file_path.with_name(f"{self.movie_file_path.stem}.part.mp4")
+        fps = int(config.frame_rate) if config.frame_rate == int(config.frame_rate) else config.frame_rate
+        command = [
+            config.ffmpeg_executable, "-y",
+            "-f", "rawvideo", "-s", f"{config.pixel_width}x{config.pixel_height}", "-pix_fmt", "rgba",
+            "-r", str(fps), "-i", "-", "-an",
+            "-loglevel", config.ffmpeg_loglevel.lower(),
+            "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+            "-vcodec", "libx264", "-pix_fmt", "yuv420p", str(self.stream_path),
+        ]
+        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if write_to_movie() and allow_write:
+            self.open_stream()
+
+    def end_animation(self, allow_write=False):
+        pass  # der Encoder bleibt offen
+
+    def write_frame(self, frame_or_renderer):
+        frame = frame_or_renderer
+        if write_to_movie():
+            self.writing_process.stdin.write(memoryview(np.ascontiguousarray(frame)).cast("B"))
+            self.frames_written += 1
+            if self.plays:
+                self.plays[-1]["frames"] += 1
+
+    def finish(self):
+        if not write_to_movie():
+            return super().finish()
+        if self.writing_process is None:
+            return
+        self.writing_process.stdin.close()
+        self.writing_process.wait()
+        os.replace(self.stream_path, self.movie_file_path)
+        for play in self.plays:
+            play["offset"] = play["start"] * self.frame_bytes
+        self.index_path.write_text(json.dumps({
+            "width": config.pixel_width, "height": config.pixel_height, "fps": config.frame_rate,
+            "frame_bytes": self.frame_bytes, "plays": self.plays,
+        }, indent=1))
+        logger.info(f"{len(self.plays)} plays in einem Encoder-Lauf, {self.reused} aus dem vorigen Video übernommen, "
+                    f"{getattr(self.renderer, 'held_frames', 0)} von {self.frames_written} Frames wiederholt")
+        self.print_file_ready_message(str(self.movie_file_path))
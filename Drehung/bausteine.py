@@ -0,0 +1,386 @@
+from manim import *
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+import manim
+
+from entwurf import draft_enabled, draft_plane_config
+from geometrie import rotate_points
+
+CACHE_DIR = Path(__file__).resolve().parent / "media" / "cache"
+
+# ---------- Koordinatensystem der Lektionen ----------
+PLANE_CONFIG = dict(
+    x_range=[-6, 6, 1],
+    y_range=[-3, 4, 1],
+    background_line_style={"stroke_color": GREY, "stroke_width": 1, "stroke_opacity": 0.35},
+    axis_config={"stroke_color": GREY_B, "stroke_width": 2, "stroke_opacity": 0.8, "include_tip": True},
+)
+COORDINATES_CONFIG = dict(font_size=20, stroke_width=1, num_decimal_places=0)
+
+_planes = {}
+
+
+def _plane_key(plane_config, coordinates, scale, draft=False):
+    data = json.dumps([plane_config, coordinates, scale, manim.__version__,
+                       config.frame_width, config.frame_height, draft], sort_keys=True, default=str)
+    return hashlib.sha1(data.encode()).hexdigest()[:16]
+
+
+def cached_plane(scale=0.95, coordinates=None, **plane_config):
+    """
+    NumberPlane mit Koordinaten, wie in allen Lektionen verwendet.
+    Wird je Konfiguration nur einmal pro Prozess gebaut (bzw. aus media/cache geladen);
+    jeder Aufruf liefert eine Kopie des Prototyps.
+    """
+    plane_config = {**PLANE_CONFIG, **plane_config}
+    if draft_enabled():
+        plane_config = draft_plane_config(plane_config)  # Entwurf: weniger Gitterlinien, Platzhalter-Zahlen
+    coordinates = COORDINATES_CONFIG if coordinates is None else coordinates
+    key = _plane_key(plane_config, coordinates, scale, draft_enabled())
+
+    if key not in _planes:
+        path = CACHE_DIR / f"plane_{key}.pkl"
+        try:
+            _planes[key] = pickle.loads(path.read_bytes())
+        except Exception:
+            plane = NumberPlane(**plane_config).add_coordinates(**coordinates).scale(scale)
+            _planes[key] = plane
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # erst vollständig schreiben, dann umbenennen (parallele Render-Prozesse)
+                tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_bytes(pickle.dumps(plane))
+                tmp.replace(path)
+            except Exception:
+                pass  # Plattencache ist nur eine Beschleunigung
+    return _planes[key].copy()
+
+
+# ---------- Text-Cache ----------
+TEXT_CACHE_DIR = CACHE_DIR / "text"
+TEXT_CACHE_BYTES = 64 * 1024 ** 2
+# nur diese Parameter bestimmen die Geometrie; alles andere (t2c, gradient, ...) geht am Cache vorbei
+TEXT_GEOMETRY = {"font", "font_size", "weight", "slant", "line_spacing", "disable_ligatures"}
+
+_texts = {}
+
+
+def _text_key(text, kwargs):
+    data = json.dumps([text, kwargs, manim.__version__], sort_keys=True, default=str)
+    return hashlib.sha1(data.encode()).hexdigest()[:16]
+
+
+def cached_text(text, color=None, **kwargs):
+    """
+    Text(text, **kwargs) aus einem inhaltsadressierten Cache: Schlüssel sind Zeichenkette, Schrift,
+    Größe, Gewicht usw. - ohne Farbe, die wird auf die Kopie gesetzt. Pango und das SVG-Parsen
+    laufen je Text einmal für alle Szenen und Render-Prozesse (media/cache/text, LRU auf
+    TEXT_CACHE_BYTES begrenzt); jeder Aufruf liefert eine Kopie.
+    """
+    if set(kwargs) - TEXT_GEOMETRY:
+        return Text(text, **kwargs) if color is None else Text(text, color=color, **kwargs)
+    key = _text_key(text, kwargs)
+    if key not in _texts:
+        path = TEXT_CACHE_DIR / f"{key}.pkl"
+        try:
+            _texts[key] = pickle.loads(path.read_bytes())
+            os.utime(path)  # zuletzt benutzt
+        except Exception:
+            _texts[key] = Text(text, **kwargs)
+            if not draft_enabled():  # keine Platzhalter in den gemeinsamen Cache
+                _store_text(path, _texts[key])
+    copy = _texts[key].copy()
+    return copy if color is None else copy.set_color(color)
+
+
+def _store_text(path, text):
+    try:
+        TEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(text))
+        tmp.replace(path)
+        evict_texts()
+    except Exception:
+        pass  # Plattencache ist nur eine Beschleunigung
+
+
+def evict_texts(limit=TEXT_CACHE_BYTES):
+    """Löscht die am längsten unbenutzten Einträge, bis der Text-Cache höchstens limit Bytes belegt."""
+    entries = []
+    for path in TEXT_CACHE_DIR.glob("*.pkl"):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue  # von einem anderen Prozess entfernt
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+# ---------- exakte Drehlagen ----------
+def snap_rotation(mobject, reference, angle, about=ORIGIN):
+    """
+    Setzt die Punkte von mobject auf die um angle gedrehten Punkte von reference (gleiche Struktur,
+    z.B. eine Kopie vor der Drehung). Nach Rotate-Animationen verschwindet so die Rundungsdrift:
+    120°, 240°, 360° liefern immer dieselben, bei 360° genau die ursprünglichen Punkte.
+    """
+    for mob, ref in zip(mobject.family_members_with_points(), reference.family_members_with_points()):
+        rotate_points(ref.points, angle, about, out=mob.points)
+    return mobject
+
+
+# ---------- Windrad ----------
+class Windmill(VMobject):
+    """
+    Windrad/Rosette mit n Flügeln als ein einziges VMobject (ein Teilpfad je Flügel), die Geometrie
+    aller Flügel in einem vektorisierten Schritt. Rotate, FadeToColor und copy() arbeiten so auf
+    einem Punkt-Array statt auf n Polygonen.
+
+    shape: Flügelform als (Radius, Winkel)-Paare relativ zur Flügelachse;
+           Standard ist das Dreieck [(hub, spread), (radius, 0), (hub, -spread)]
+    Einzelne Flügel: get_blade_vertices(i), get_blade(i) (eigenes Polygon, z.B. zum Hervorheben).
+    """
+
+    def __init__(self, n=3, radius=1.6, hub=0.3, spread=0.5, shape=None, center=ORIGIN,
+                 stroke_width=2, fill_opacity=0.85, **kwargs):
+        self.n = n
+        self.shape = np.array(shape if shape is not None else [(hub, spread), (radius, 0), (hub, -spread)], float)
+        self.hub_center = np.array(center, dtype=float)
+        super().__init__(stroke_width=stroke_width, fill_opacity=fill_opacity, **kwargs)
+
+    def generate_points(self):
+        n, k = self.n, len(self.shape)
+        angles = np.arange(n)[:, None] * TAU / n + self.shape[:, 1]
+        verts = rotate_points(np.outer(np.tile(self.shape[:, 0], n), RIGHT), angles.ravel()).reshape(n, k, 3)
+        verts += self.hub_center
+        # geschlossene Teilpfade aus geraden Bézier-Stücken wie set_points_as_corners
+        start = verts
+        end = np.roll(verts, -1, axis=1)
+        t = np.linspace(0, 1, self.n_points_per_cubic_curve)[:, None]
+        self.points = (start[:, :, None] + t * (end - start)[:, :, None]).reshape(-1, 3)
+
+    def blade_slice(self, i):
+        size = len(self.shape) * self.n_points_per_cubic_curve
+        return slice(i * size, (i + 1) * size)
+
+    def get_blade_vertices(self, i=None):
+        """Aktuelle Ecken eines Flügels (k,3) bzw. aller Flügel (n,k,3)."""
+        anchors = self.points[::self.n_points_per_cubic_curve].reshape(self.n, len(self.shape), 3)
+        return anchors if i is None else anchors[i]
+
+    def get_blade(self, i):
+        """Flügel i als eigenes Polygon im Stil des Windrads."""
+        return Polygon(*self.get_blade_vertices(i)).match_style(self)
+
+
+# ---------- Punktmarkierungen ----------
+MARKER_POINTS = 8  # zwei gerade Bézier-Stücke je Kreuz
+
+
+def _per_marker(value, n, color=False):
+    """Wert je Marker: Folge der Länge n oder ein Wert für alle (bei Farben ist eine RGB-Zahlenfolge ein Wert)."""
+    if not isinstance(value, (list, tuple, np.ndarray)) or np.ndim(value) == 0 or len(value) != n:
+        return [value] * n
+    if color and all(isinstance(v, (int, float, np.number)) for v in value):
+        return [value] * n
+    return list(value)
+
+
+class MarkerCloud(VMobject):
+    """
+    N Kreuz-Markierungen wie Cross(Dot(p)) aus einem (N,3)-Positionsarray in einem Mobject.
+    Marker gleichen Stils (Farbe, Deckkraft, Strichbreite) teilen sich ein Teil-VMobject, sodass
+    auch hunderte Punkte nur wenige Zeichenaufrufe kosten. Farbe, Deckkraft und Strichbreite
+    können je Marker angegeben werden (Liste der Länge N).
+
+    Einzelne Marker: get_position(i), marker(i) (eigenes Mobject, z.B. für next_to),
+    set_markers(idx, ...) und die Animationen AnimateMarkers / IndicateMarkers.
+    """
+
+    def __init__(self, positions, color=WHITE, opacity=1.0, stroke_width=3, size=DEFAULT_DOT_RADIUS, **kwargs):
+        super().__init__(**kwargs)
+        pos = np.atleast_2d(np.asarray(positions, dtype=float))
+        if pos.shape[1] == 2:
+            pos = np.hstack([pos, np.zeros((len(pos), 1))])
+        n = len(pos)
+        self.size = size
+        self.styles = []
+        style_of = [self.style_id(c, o, w) for c, o, w in zip(_per_marker(color, n, color=True),
+                                                                _per_marker(opacity, n), _per_marker(stroke_width, n))]
+        self.regroup(self.cross_points(pos), np.array(style_of, dtype=int))
+
+    # --- Geometrie ---
+    def cross_points(self, positions):
+        """(N,8,3): je Marker die Diagonalen UL->DR und UR->DL."""
+        r = self.size
+        corners = np.array([[-r, r, 0], [r, -r, 0], [r, r, 0], [-r, -r, 0]])
+        t = np.linspace(0, 1, self.n_points_per_cubic_curve)[:, None]
+        segments = np.concatenate([corners[0] + t * (corners[1] - corners[0]),
+                                   corners[2] + t * (corners[3] - corners[2])])
+        return positions[:, None, :] + segments
+
+    @property
+    def n_markers(self):
+        return len(self.style_of)
+
+    def get_marker_points(self):
+        out = np.empty((self.n_markers, MARKER_POINTS, 3))
+        for k, layer in enumerate(self.submobjects):
+            out[self.layer_of == k] = layer.points.reshape(-1, MARKER_POINTS, 3)
+        return out
+
+    def set_marker_points(self, idx, points):
+        idx = np.atleast_1d(idx)
+        for k in np.unique(self.layer_of[idx]):
+            sel = self.layer_of[idx] == k
+            layer_points = self.submobjects[k].points.reshape(-1, MARKER_POINTS, 3)
+            layer_points[self.slot_of[idx[sel]]] = points[sel]
+        return self
+
+    def get_positions(self):
+        return self.get_marker_points().mean(axis=1)
+
+    def get_position(self, i):
+        layer = self.submobjects[self.layer_of[i]]
+        return layer.points.reshape(-1, MARKER_POINTS, 3)[self.slot_of[i]].mean(axis=0)
+
+    def marker(self, i):
+        """Marker i als eigenes VMobject (gleiche Lage und Stil)."""
+        layer = self.submobjects[self.layer_of[i]]
+        single = VMobject().match_style(layer)
+        single.points = layer.points.reshape(-1, MARKER_POINTS, 3)[self.slot_of[i]].copy()
+        return single
+
+    def copy_markers(self, idx):
+        """Neue MarkerCloud aus den Markern idx (Stil und Lage übernommen)."""
+        idx = np.atleast_1d(idx)
+        colors, opacities, widths = zip(*[self.styles[s] for s in self.style_of[idx]])
+        return MarkerCloud(self.get_positions()[idx], color=list(colors), opacity=list(opacities),
+                           stroke_width=list(widths), size=self.size)
+
+    # --- Stil ---
+    def style_id(self, color, opacity, stroke_width, unique=False):
+        style = (ManimColor(color), float(opacity), float(stroke_width))
+        if not unique:
+            for k, known in enumerate(self.styles):
+                if known[0].to_hex() == style[0].to_hex() and known[1:] == style[1:]:
+                    return k
+        self.styles.append(style)
+        return len(self.styles) - 1
+
+    def regroup(self, marker_points, style_of):
+        """Verteilt die Marker auf ein Teil-VMobject je Stil (Reihenfolge fest -> deterministisch)."""
+        self.style_of = np.asarray(style_of)
+        self.layer_of = np.empty(len(self.style_of), dtype=int)
+        self.slot_of = np.empty(len(self.style_of), dtype=int)
+        self.layer_index = {}
+        layers = []
+        for k, sid in enumerate(np.unique(self.style_of)):
+            ids = np.flatnonzero(self.style_of == sid)
+            self.layer_index[sid] = k
+            color, opacity, width = self.styles[sid]
+            layer = VMobject(stroke_color=color, stroke_opacity=opacity, stroke_width=width, fill_opacity=0)
+            layer.points = marker_points[ids].reshape(-1, 3)
+            self.layer_of[ids] = k
+            self.slot_of[ids] = np.arange(len(ids))
+            layers.append(layer)
+        self.submobjects = layers
+        return self
+
+    def set_markers(self, idx, positions=None, color=None, opacity=None, stroke_width=None):
+        """Sofortige Änderung einzelner Marker (ohne Animation)."""
+        idx = np.atleast_1d(idx)
+        points = self.get_marker_points()
+        if positions is not None:
+            points[idx] += (np.asarray(positions, dtype=float) - points[idx].mean(axis=1))[:, None, :]
+        style_of = self.style_of.copy()
+        if color is not None or opacity is not None or stroke_width is not None:
+            for i in idx:
+                c, o, w = self.styles[style_of[i]]
+                style_of[i] = self.style_id(c if color is None else color, o if opacity is None else opacity,
+                                            w if stroke_width is None else stroke_width)
+        return self.regroup(points, style_of)
+
+
+class AnimateMarkers(Animation):
+    """
+    Animiert einzelne Marker einer MarkerCloud über ihre Indizes: verschieben (positions oder shift),
+    umfärben, ein-/ausblenden (opacity), Strichbreite und Größe (scale). Die übrigen Marker bleiben
+    unberührt in ihren gemeinsamen Teil-VMobjects.
+    """
+
+    def __init__(self, cloud, idx, positions=None, shift=None, color=None, opacity=None, stroke_width=None,
+                 scale=1.0, **kwargs):
+        self.idx = np.atleast_1d(idx)
+        self.targets = positions
+        self.shift_by = shift
+        self.scale = scale
+        # Marker mit Stiländerung schon hier in eigene Teil-VMobjects (eins je Ausgangsstil):
+        # Scene.play bestimmt die bewegten Mobjects vor begin()
+        self.style_changes = []
+        target = (color, opacity, stroke_width)
+        if any(v is not None for v in target):
+            style_of = cloud.style_of.copy()
+            temp = {}
+            for i in self.idx:
+                if style_of[i] not in temp:
+                    start = cloud.styles[style_of[i]]
+                    end = tuple(s if t is None else t for s, t in zip(start, target))
+                    temp[style_of[i]] = cloud.style_id(*start, unique=True)
+                    self.style_changes.append((temp[style_of[i]], start, (ManimColor(end[0]), *map(float, end[1:]))))
+                style_of[i] = temp[style_of[i]]
+            cloud.regroup(cloud.get_marker_points(), style_of)
+        super().__init__(cloud, **kwargs)
+
+    def begin(self):
+        points = self.mobject.get_marker_points()[self.idx]
+        self.centers = points.mean(axis=1)
+        self.start_points = points
+        if self.targets is not None:
+            self.offsets = np.asarray(self.targets, dtype=float) - self.centers
+        elif self.shift_by is not None:
+            self.offsets = np.broadcast_to(np.asarray(self.shift_by, dtype=float), self.centers.shape)
+        else:
+            self.offsets = np.zeros_like(self.centers)
+        super().begin()
+
+    def style_at(self, start, end, a):
+        (c0, o0, w0), (c1, o1, w1) = start, end
+        return interpolate_color(c0, c1, a), o0 + (o1 - o0) * a, w0 + (w1 - w0) * a
+
+    def interpolate_mobject(self, alpha):
+        a = self.rate_func(alpha)
+        cloud = self.mobject
+        centers = self.centers[:, None, :]
+        points = (self.start_points - centers) * (1 + (self.scale - 1) * a) + centers + a * self.offsets[:, None, :]
+        cloud.set_marker_points(self.idx, points)
+        for sid, start, end in self.style_changes:
+            color, opacity, width = self.style_at(start, end, a)
+            cloud.submobjects[cloud.layer_index[sid]].set_stroke(color, width=width, opacity=opacity)
+
+    def finish(self):
+        super().finish()
+        if self.style_changes:
+            # Endstil fest übernehmen; gleiche Stile wieder in einem Teil-VMobject zusammenführen
+            cloud = self.mobject
+            style_of = cloud.style_of.copy()
+            a = self.rate_func(1)
+            for sid, start, end in self.style_changes:
+                style_of[style_of == sid] = cloud.style_id(*self.style_at(start, end, a))
+            cloud.regroup(cloud.get_marker_points(), style_of)
+
+
+class IndicateMarkers(AnimateMarkers):
+    """Wie Indicate, aber nur für die Marker idx: kurz vergrößern und einfärben."""
+
+    def __init__(self, cloud, idx, color=YELLOW, scale_factor=1.2, **kwargs):
+        kwargs.setdefault("rate_func", there_and_back)
+        super().__init__(cloud, idx, color=color, scale=scale_factor, **kwargs)
@@ -0,0 +1,80 @@
+"""
+Mikrobenchmark für die Geometrie-Hilfen (ohne Manim lauffähig):
+    python bench_geometrie.py
+"""
+import time
+
+import numpy as np
+
+from geometrie import rotate_points, rotation_from_pairs
+
+
+def rotate_point_scalar(pt, angle, about=np.array([0, 0, 0])):
+    # alte Variante aus den Szenen: eine 2x2-Matrix und mehrere Arrays pro Punkt
+    v = np.array(pt) - np.array(about)
+    c, s = np.cos(angle), np.sin(angle)
+    R = np.array([[c, -s], [s, c]])
+    v2 = R @ v[:2]
+    return np.array([v2[0], v2[1], 0]) + np.array(about)
+
+
+def timed(label, fn, repeat=3):
+    best = min(_run(fn) for _ in range(repeat))
+    print(f"{label:<40s} {best * 1000:10.2f} ms")
+    return best
+
+
+def _run(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def bench_rotation(n=10 ** 6):
+    rng = np.random.default_rng(0)
+    pts = rng.uniform(-5, 5, size=(n, 3))
+    pts[:, 2] = 0
+    angles = rng.uniform(0, 2 * np.pi, size=n)
+    about = np.array([0.5, -0.3, 0.0])
+    out = np.empty_like(pts)
+
+    print(f"Drehung von {n} Punkten")
+    t_scalar = timed("rotate_point (skalar, Schleife)",
+                     lambda: [rotate_point_scalar(p, 0.7, about) for p in pts], repeat=1)
+    t_vec = timed("rotate_points (ein Winkel)", lambda: rotate_points(pts, 0.7, about))
+    timed("rotate_points (ein Winkel, out=)", lambda: rotate_points(pts, 0.7, about, out=out))
+    timed("rotate_points (Winkel je Punkt, out=)", lambda: rotate_points(pts, angles, about, out=out))
+    print(f"Speedup: {t_scalar / t_vec:.0f}x")
+    timed("rotate_points (90°, nur Vertauschen)", lambda: rotate_points(pts, np.pi / 2, about, out=out))
+    timed("rotate_points (120°, Tabellenwert)", lambda: rotate_points(pts, 2 * np.pi / 3, about, out=out))
+
+    check = np.array([rotate_point_scalar(p, 0.7, about) for p in pts[:1000]])
+    assert np.allclose(check, rotate_points(pts[:1000], 0.7, about))
+    # Vierteldrehungen exakt: viermal 90° um ein Gitterzentrum ergibt bitgenau die Ausgangspunkte
+    grid = rng.integers(-6, 7, size=(1000, 3)).astype(float)
+    turned = grid
+    for _ in range(4):
+        turned = rotate_points(turned, np.pi / 2, about=(1, -2, 0))
+    assert np.array_equal(turned, grid)
+
+
+def bench_solver(figures=10 ** 5, k=3):
+    rng = np.random.default_rng(1)
+    centres = rng.uniform(-3, 3, size=(figures, 2))
+    angles = rng.uniform(-3, 3, size=figures)
+    pts = rng.uniform(-4, 4, size=(figures, k, 2))
+    images = rotate_points(pts.reshape(-1, 2), np.repeat(angles, k), about=np.repeat(centres, k, axis=0))
+    images = images.reshape(figures, k, 2)
+    images[::100, 0] += 0.5  # jede 100. Figur ist keine Drehung
+
+    print(f"Drehzentrum/-winkel für {figures} Figuren mit je {k} Punktpaaren")
+    timed("rotation_from_pairs", lambda: rotation_from_pairs(pts, images))
+    found, phi, residuals = rotation_from_pairs(pts, images)
+    ok = residuals < 1e-9
+    assert not ok[::100].any() and ok.sum() == figures - len(ok[::100])
+    assert np.allclose(found[ok], centres[ok], atol=1e-6) and np.allclose(phi[ok], angles[ok])
+
+
+if __name__ == "__main__":
+    bench_rotation()
+    bench_solver()
@@ -0,0 +1,169 @@
+"""
+Automatische Platzierung von Punktbeschriftungen.
+
+Jede Beschriftung bekommt eine der Lagen wie bei next_to(anker, UR/UL/..., buff) - die erste
+freie in der Vorzugsreihenfolge. Frei heißt: keine Überlappung mit bereits gesetzten
+Beschriftungen, mit den Hindernissen (Linien, Flächen, Markierungen) und dem Bildrand.
+Gesetzte Boxen und Hindernis-Stützpunkte liegen in einem gleichmäßigen Gitter (Spatial Hash),
+jede Abfrage prüft nur die Zellen unter der Kandidaten-Box: insgesamt etwa linear in der Zahl
+der Beschriftungen und Stützpunkte.
+Keine Zufallszahlen - gleiche Eingabe, gleiche Lagen (Render-Caches bleiben gültig).
+
+    place_labels([P_label, Q_label], [P, Q], obstacles=[triangle, segment])
+"""
+from collections import defaultdict
+
+from manim import *
+
+# Vorzugsreihenfolge wie in den Szenen üblich: zuerst UR
+DIRECTIONS = [UR, UL, DR, DL, RIGHT, UP, LEFT, DOWN]
+SAMPLES_PER_CURVE = 8
+
+
+class SpatialGrid:
+    """Gleichmäßiges Gitter über Achsen-parallelen Boxen (xmin, ymin, xmax, ymax)."""
+
+    def __init__(self, cell):
+        self.cell = cell
+        self.cells = defaultdict(list)
+        self.boxes = []
+
+    def _range(self, box):
+        c = self.cell
+        return (range(int(np.floor(box[0] / c)), int(np.floor(box[2] / c)) + 1),
+                range(int(np.floor(box[1] / c)), int(np.floor(box[3] / c)) + 1))
+
+    def insert(self, box):
+        k = len(self.boxes)
+        self.boxes.append(box)
+        xs, ys = self._range(box)
+        for i in xs:
+            for j in ys:
+                self.cells[i, j].append(k)
+
+    def insert_points(self, points):
+        """Viele Stützpunkte auf einmal als Boxen der Größe 0."""
+        for x, y in points[:, :2].tolist():
+            self.insert((x, y, x, y))
+
+    def overlap(self, box):
+        """Summe der Überlappungsflächen (Punkte zählen mit einer kleinen Fläche) mit allen Einträgen."""
+        xs, ys = self._range(box)
+        seen = set()
+        total = 0.0
+        for i in xs:
+            for j in ys:
+                for k in self.cells.get((i, j), ()):
+                    if k in seen:
+                        continue
+                    seen.add(k)
+                    other = self.boxes[k]
+                    w = _axis_overlap(box[0], box[2], other[0], other[2])
+                    h = _axis_overlap(box[1], box[3], other[1], other[3])
+                    if w is not None and h is not None:
+                        total += max(w * h, 1e-3)
+        return total
+
+
+def _axis_overlap(lo, hi, other_lo, other_hi):
+    """Überlappung zweier Intervalle, None ohne; bloßes Berühren zählt nicht (Stützpunkte: echt innen)."""
+    if other_lo == other_hi:
+        return 0.0 if lo < other_lo < hi else None
+    w = min(hi, other_hi) - max(lo, other_lo)
+    return w if w > 0 else None
+
+
+def outline_samples(mobject):
+    """Punkte entlang aller Bézier-Kurven eines Mobjects (samt Familie), vektorisiert."""
+    chunks = []
+    t = np.linspace(0, 1, SAMPLES_PER_CURVE)[:, None]
+    weights = np.hstack([(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3])  # (S,4)
+    for m in mobject.family_members_with_points():
+        n = m.n_points_per_cubic_curve if isinstance(m, VMobject) else 1
+        if n != 4 or len(m.points) % 4:
+            chunks.append(m.points)
+            continue
+        curves = m.points.reshape(-1, 4, 3)
+        chunks.append(np.einsum("sk,ckd->csd", weights, curves).reshape(-1, 3))
+        if m.get_fill_opacity() > 0:
+            chunks.append(interior_samples(m))
+    return np.vstack(chunks) if chunks else np.zeros((0, 3))
+
+
+def interior_samples(vmobject, spacing=0.15):
+    """
+    Gitterpunkte innerhalb einer gefüllten Fläche (gerade-ungerade-Regel über die Ankerpunkte).
+    Die Kanten werden je Teilpfad geschlossen (Windrad-Flügel, MarkerCloud: keine Kanten zwischen den Teilen).
+    """
+    n = vmobject.n_points_per_cubic_curve
+    rings = [np.vstack([sub[::n], sub[-1:]])[:, :2] for sub in vmobject.get_subpaths() if len(sub)]
+    if not rings:
+        return np.zeros((0, 3))
+    anchors = np.vstack(rings)
+    (x0, y0), (x1, y1) = anchors.min(axis=0), anchors.max(axis=0)
+    gx, gy = np.meshgrid(np.arange(x0, x1, spacing), np.arange(y0, y1, spacing))
+    pts = np.stack([gx.ravel(), gy.ravel()], axis=1)
+    a, b = anchors, np.vstack([np.roll(ring, -1, axis=0) for ring in rings])
+    px, py = pts[:, None, 0], pts[:, None, 1]
+    crosses = ((a[:, 1] > py) != (b[:, 1] > py)) & \
+              (px < (b[:, 0] - a[:, 0]) * (py - a[:, 1]) / np.where(b[:, 1] == a[:, 1], 1, b[:, 1] - a[:, 1]) + a[:, 0])
+    inside = crosses.sum(axis=1) % 2 == 1
+    return np.hstack([pts[inside], np.zeros((inside.sum(), 1))])
+
+
+def _anchor_box(anchor):
+    if isinstance(anchor, Mobject):
+        lo, hi = anchor.get_corner(DL), anchor.get_corner(UR)
+    else:
+        lo = hi = np.asarray(anchor, dtype=float)
+    return lo[:2], hi[:2]
+
+
+def candidate_box(label_size, anchor_box, direction, buff):
+    """Box der Beschriftung bei next_to(anker, direction, buff)."""
+    (lo, hi), half = anchor_box, label_size / 2
+    d = direction[:2]
+    corner = np.where(d > 0, hi, np.where(d < 0, lo, (lo + hi) / 2))
+    center = corner + d * (buff + half)
+    return (center[0] - half[0], center[1] - half[1], center[0] + half[0], center[1] + half[1]), center
+
+
+def place_labels(labels, anchors, obstacles=(), buff=0.05, directions=DIRECTIONS, prefer=None,
+                 frame_margin=0.1):
+    """
+    Setzt jede Beschriftung labels[i] neben anchors[i] (Mobject oder Punkt) in die erste freie
+    Richtung aus directions; gibt es keine, in die mit der kleinsten Überlappung.
+    obstacles: Mobjects, die nicht verdeckt werden sollen (die Anker zählen automatisch dazu).
+    prefer: optional je Beschriftung eine Richtung, die zuerst versucht wird (z.B. die bisherige).
+    Gibt die gewählten Richtungen zurück.
+    """
+    sizes = [np.array([label.width, label.height]) for label in labels]
+    anchor_boxes = [_anchor_box(a) for a in anchors]
+    cell = max(0.25, float(np.median([s.max() for s in sizes])) if sizes else 0.25)
+
+    obstacle_grid = SpatialGrid(cell)
+    for obstacle in obstacles:
+        obstacle_grid.insert_points(outline_samples(obstacle))
+    for lo, hi in anchor_boxes:
+        obstacle_grid.insert((lo[0], lo[1], hi[0], hi[1]))
+    label_grid = SpatialGrid(cell)
+
+    fx, fy = config.frame_width / 2 - frame_margin, config.frame_height / 2 - frame_margin
+    chosen = []
+    prefer = prefer or [None] * len(labels)
+    for label, size, anchor_box, first in zip(labels, sizes, anchor_boxes, prefer):
+        order = list(directions) if first is None else [first] + [d for d in directions if not np.array_equal(d, first)]
+        best = None
+        for rank, direction in enumerate(order):
+            box, center = candidate_box(size, anchor_box, direction, buff)
+            outside = max(0.0, -fx - box[0]) + max(0.0, box[2] - fx) + max(0.0, -fy - box[1]) + max(0.0, box[3] - fy)
+            cost = 10 * label_grid.overlap(box) + obstacle_grid.overlap(box) + 10 * outside
+            if best is None or cost < best[0]:
+                best = (cost, rank, box, center, direction)
+            if cost == 0:
+                break
+        _, _, box, center, direction = best
+        label.move_to([center[0], center[1], label.get_center()[2]])
+        label_grid.insert(box)
+        chosen.append(direction)
+    return chosen
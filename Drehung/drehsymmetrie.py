@@ -1,39 +1,15 @@
 from manim import *
 import numpy as np
 
+from abhaengigkeiten import when_changed
+from bausteine import Windmill, cached_text, snap_rotation
+from geometrie import rotational_symmetry
+from lektion import LessonScene
+
 # ---------- Config ----------
 config.background_color = "#0e0e0e"
 
 
-# ---------- Helpers ----------
-def rotate_point(pt, angle, about=(0, 0, 0)):
-    pt = np.array(pt, dtype=float)
-    if pt.shape[0] == 2:
-        pt = np.array([pt[0], pt[1], 0.0])
-    about = np.array(about, dtype=float)
-    if about.shape[0] == 2:
-        about = np.array([about[0], about[1], 0.0])
-    v = pt - about
-    c, s = np.cos(angle), np.sin(angle)
-    R = np.array([[c, -s], [s, c]])
-    v2 = R @ v[:2]
-    return np.array([v2[0], v2[1], 0.0]) + about
-
-
-def make_windmill_three(radius=1.6, color=BLUE, fill_opacity=0.85):
-    blades = VGroup()
-    n = 3
-    for k in range(n):
-        angle = k * TAU / n
-        tip = rotate_point(RIGHT * radius, angle)
-        base1 = rotate_point(RIGHT * 0.3, angle + 0.5)
-        base2 = rotate_point(RIGHT * 0.3, angle - 0.5)
-        tri = Polygon(base1, tip, base2, stroke_width=2, fill_opacity=fill_opacity, color=color)
-        blades.add(tri)
-    center = Cross(Dot([0, 0, 0]), stroke_color=YELLOW, stroke_width=3)
-    return blades, center
-
-
 class ProgressBar(VGroup):
     def __init__(self, sections, **kwargs):
         super().__init__(**kwargs)
@@ -47,8 +23,8 @@ class ProgressBar(VGroup):
         for i in range(n):
             x = -total_w / 2 + i * spacing
             circ = Circle(radius=0.22, stroke_width=2, color=GRAY).move_to([x, y, 0])
-            num = Text(str(i + 1), font_size=16).move_to(circ.get_center())
-            lbl = Text(sections[i], font_size=14, color=GRAY).next_to(circ, UP, buff=0.08)
+            num = cached_text(str(i + 1), font_size=16).move_to(circ.get_center())
+            lbl = cached_text(sections[i], font_size=14, color=GRAY).next_to(circ, UP, buff=0.08)
             self.add(circ, num, lbl)
             self.circles.add(circ)
             self.labels.add(lbl)
@@ -70,34 +46,86 @@ class ProgressBar(VGroup):
             line.set_color(GREEN if i < idx else GRAY)
 
 
+class DegreeReadout(VGroup):
+    """
+    Live-Anzeige "φ = …°" für einen ValueTracker (Radiant).
+    Alle Glyphen werden einmal in einem MathTex gesetzt; pro Frame werden nur
+    Kopien der Ziffern umgestellt, und das nur, wenn sich der gerundete Wert ändert.
+    """
+    chars = "-0123456789"
+
+    def __init__(self, tracker, color=RED, scale=0.7, **kwargs):
+        super().__init__(**kwargs)
+        self.tracker = tracker
+        # Referenzsatz: liefert Glyphen mit korrekter Grundlinie und TeX-Abständen
+        self.template = MathTex(r"\varphi =", *self.chars, r"^\circ", color=color).scale(scale)
+        self.glyphs = dict(zip(self.chars, self.template[1:-1]))
+        self.prefix_gap = self.template[1].get_left()[0] - self.template[0].get_right()[0]
+        self.digit_gap = self.template[3].get_left()[0] - self.template[2].get_right()[0]
+        self.degree_gap = self.template[-1].get_left()[0] - self.template[-2].get_right()[0]
+
+        self.prefix = self.template[0].copy()
+        self.degree = self.template[-1].copy()
+        self.digits = VGroup()
+        self.add(self.prefix, self.digits, self.degree)
+        self.deg = None
+        self.set_degrees(self.get_degrees())
+        # läuft nur, wenn sich der Tracker bewegt (sonst auch nicht bei jedem Frame im Bild neu gerastert)
+        self.add_updater(when_changed(lambda m: m.set_degrees(m.get_degrees()), tracker))
+
+    def get_degrees(self):
+        return int(np.round(np.degrees(self.tracker.get_value())))
+
+    def set_degrees(self, deg):
+        if deg == self.deg:
+            return self
+        self.deg = deg
+        # Verschiebung gegenüber dem Referenzsatz (falls die Anzeige bewegt wurde)
+        dy = self.prefix.get_center()[1] - self.template[0].get_center()[1]
+        x = self.prefix.get_right()[0] + self.prefix_gap
+        digits = []
+        for c in str(deg):
+            glyph = self.glyphs[c].copy()
+            glyph.shift(RIGHT * (x - glyph.get_left()[0]) + UP * dy)
+            x = glyph.get_right()[0] + self.digit_gap
+            digits.append(glyph)
+        x += self.degree_gap - self.digit_gap
+        self.degree.shift(RIGHT * (x - self.degree.get_left()[0]))
+        self.digits.remove(*self.digits.submobjects)
+        self.digits.add(*digits)
+        return self
+
+
 # ---------- Scene ----------
-class DrehsymmetrieV2(Scene):
+class DrehsymmetrieV2(LessonScene):
+    sections = ["Windrad", "Quadrat"]
+    keyframes = ["windrad", "quadrat"]
+
     def construct(self):
         # Progressbar
-        prog = ProgressBar(["Windrad", "Quadrat"])
+        prog = ProgressBar(self.sections)
         self.play(FadeIn(prog))
-        prog.set_progress(0)
+        self.begin_section(prog, 0)
         self.add(prog)
+        self.set_static_layer(prog)
 
         # --- phi Anzeige helper ---
         phi_tracker = ValueTracker(0)  # radians
+        self.add(phi_tracker)  # in der Szene: Anzeige bleibt außerhalb der Drehungen im statischen Bild
 
-        def phi_tex_updater(m: MathTex):
-            deg = int(np.round(np.degrees(phi_tracker.get_value())))
-            m.become(MathTex(r"\varphi = " + f"{deg}^\circ", color=RED).scale(0.7)
-                     .move_to(DOWN * 2).shift(LEFT * 0.2 + DOWN * 0.2))
-
-        phi_display = MathTex("").scale(0.7).to_corner(UR)
-        phi_display.add_updater(lambda m: phi_tex_updater(m))
+        # Glyphen werden einmal gesetzt, das Updater tauscht nur die Ziffern
+        phi_display = DegreeReadout(phi_tracker, color=RED, scale=0.7)
+        phi_display.move_to(DOWN * 2).shift(LEFT * 0.2 + DOWN * 0.2)
         self.add(phi_display)
 
         # ---------------- Scene 1: Windrad ----------------
-        prog.set_progress(0)
-        blades, center = make_windmill_three(radius=1.8, color=BLUE, fill_opacity=0.7)
+        self.begin_section(prog, 0)
+        blades = Windmill(3, radius=1.8, color=BLUE, fill_opacity=0.7)
+        center = Cross(Dot(ORIGIN), stroke_color=YELLOW, stroke_width=3)
         blades_green = blades.copy().set_color(GREEN)
 
         # Tips as points
-        P = Cross(Dot(blades[0].get_vertices()[1]), stroke_color=BLUE, stroke_width=3)
+        P = Cross(Dot(blades.get_blade_vertices(0)[1]), stroke_color=BLUE, stroke_width=3)
         P_label = MathTex("P").next_to(P, UP)
 
         P_copy = P.copy().set_color(GREEN)
@@ -109,6 +137,9 @@ class DrehsymmetrieV2(Scene):
         # position phi tracker at 0
         phi_tracker.set_value(0)
         rot_group = VGroup(blades_green, P_copy, P_label_copy)
+        # exakte Drehlage nach jeder Animation (ohne das gegengedrehte Label)
+        snapped = VGroup(blades_green, P_copy)
+        snapped_ref = snapped.copy()
 
         # function to animate rotation to target degrees (in degrees), with optional flash
         # Funktion innerhalb von construct ersetzen
@@ -121,27 +152,23 @@ class DrehsymmetrieV2(Scene):
                 Rotate(rot_group, angle=delta, about_point=center.get_center()),
                 run_time=run_time
             )
+            snap_rotation(snapped, snapped_ref, target_rad, about=center.get_center())
             self.play(Rotate(P_label_copy, angle=-delta, about_point=P_label_copy.get_center()), run_time=0.5)
             if flash:
-                self.play(
-                    *[obj.animate.set_fill(WHITE, 1) for obj in blades_green],
-                    run_time=0.12
-                )
-                self.play(
-                    *[obj.animate.set_fill(GREEN, 1) for obj in blades_green],
-                    run_time=0.12
-                )
-
-        # rotate in steps: 120, flash, 240, flash, 360
-        rotate_to(120, run_time=1.5, flash=True)
-        rotate_to(240, run_time=1.5, flash=True)
-        rotate_to(360, run_time=1.5, flash=False)
+                self.play(blades_green.animate.set_fill(WHITE, 1), run_time=0.12)
+                self.play(blades_green.animate.set_fill(GREEN, 1), run_time=0.12)
+
+        # rotate in steps of the symmetry angle (Windrad: 120, flash, 240, flash, 360)
+        order, _, _ = rotational_symmetry(list(blades.get_blade_vertices()))
+        for k in range(1, order + 1):
+            rotate_to(360 * k / order, run_time=1.5, flash=k < order)
         self.wait(0.5)
 
         # short text note on minimal angle
-        note1 = Text("Drehsymmetrie: Figur wird durch Drehung um ein φ≠360°\nauf sich selbst abgebildet", color=ORANGE,
-                     font_size=28).move_to(DOWN * 3)
+        note1 = cached_text("Drehsymmetrie: Figur wird durch Drehung um ein φ≠360°\nauf sich selbst abgebildet", color=ORANGE,
+                            font_size=28).move_to(DOWN * 3)
         self.play(Write(note1))
+        self.checkpoint("windrad")
         self.wait(0.9)
         self.play(FadeOut(note1), run_time=0.5)
         # fade green a bit to show both
@@ -153,7 +180,7 @@ class DrehsymmetrieV2(Scene):
         phi_tracker.set_value(0)
 
         # ---------- 2) Quadrat (Drehsymmetrie & Punktsymmetrie) ----------
-        prog.set_progress(1)
+        self.begin_section(prog, 1)
 
         # Quadrat erstellen
         square_blue = Square(side_length=2.4, color=BLUE, fill_opacity=0.6).move_to(ORIGIN)
@@ -165,6 +192,8 @@ class DrehsymmetrieV2(Scene):
         P_copy = P.copy().set_color(GREEN)
         P_label_copy = MathTex("P'").next_to(P, RIGHT)
         rot_group = VGroup(P_copy, P_label_copy, square_green)
+        snapped = VGroup(P_copy, square_green)
+        snapped_ref = snapped.copy()
 
         self.play(Create(square_blue), FadeIn(Z, P, P_copy), Write(P_label), Write(P_label_copy))
 
@@ -177,6 +206,7 @@ class DrehsymmetrieV2(Scene):
                        about_point=Z.get_center()),
                 run_time=run_time
             )
+            snap_rotation(snapped, snapped_ref, target_rad, about=Z.get_center())
             self.play(Rotate(P_label_copy, angle=-PI/2,
                              about_point=P_label_copy.get_center()), run_time=0.1)
             if flash:
@@ -191,10 +221,11 @@ class DrehsymmetrieV2(Scene):
         self.wait(0.5)
         rotate_to(180, flash=True)
 
-        punk_text = Text("Punktsymmetrie = Drehsymmetrie für φ=180°", color=ORANGE, font_size=26).move_to(DOWN * 3)
+        punk_text = cached_text("Punktsymmetrie = Drehsymmetrie für φ=180°", color=ORANGE, font_size=26).move_to(DOWN * 3)
         self.play(Write(punk_text))
 
         rotate_to(270)
         self.wait(0.5)
         rotate_to(360)
+        self.checkpoint("quadrat")
         self.wait(2)
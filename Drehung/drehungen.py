@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 
+from bausteine import IndicateMarkers, MarkerCloud, Windmill, cached_plane, cached_text
+from geometrie import rotate_point, rotate_points
+from lektion import LessonScene
+
 # ---------- Config ----------
 config.background_color = "#0e0e0e"
 
@@ -12,33 +16,6 @@ config.background_color = "#0e0e0e"
 
 
 # ---------- Helpers ----------
-def rotate_point(pt, angle, about=np.array([0, 0, 0])):
-    v = np.array(pt) - np.array(about)
-    c, s = np.cos(angle), np.sin(angle)
-    R = np.array([[c, -s], [s, c]])
-    v2 = R @ v[:2]
-    return np.array([v2[0], v2[1], 0]) + np.array(about)
-
-
-def make_windmill_three(radius=1.6, color=BLUE):
-    """
-    Windrad mit 3 klaren Dreiecken (spitz nach außen) und einer Nabe (Dot).
-    Rückgabe: blades (VGroup), center (Dot)
-    """
-    blades = VGroup()
-    n = 3
-    for k in range(n):
-        angle = k * TAU / n
-        tip = rotate_point(RIGHT * radius, angle)
-        # zwei Basispunkte nahe der Mitte (dreieck)
-        base1 = rotate_point(RIGHT * 0.3, angle + 0.5)
-        base2 = rotate_point(RIGHT * 0.3, angle - 0.5)
-        tri = Polygon(base1, tip, base2, stroke_width=2, fill_opacity=0.85, color=color)
-        blades.add(tri)
-    center = Dot([0, 0, 0], color=YELLOW)
-    return blades, center
-
-
 def perp_bisector_points(A, B, length=6):
     A = np.array(A);
     B = np.array(B)
@@ -81,9 +58,9 @@ class ProgressBar(VGroup):
             circ = Circle(radius=0.22, stroke_width=2, color=GRAY)
             circ.move_to([x, y, 0])
             self.circles.add(circ)
-            num = Text(str(i + 1), font_size=16).move_to(circ.get_center())
+            num = cached_text(str(i + 1), font_size=16).move_to(circ.get_center())
             # labels ABOVE circles, smaller
-            lbl = Text(sections[i], font_size=14, color=GRAY).next_to(circ, UP, buff=0.08)
+            lbl = cached_text(sections[i], font_size=14, color=GRAY).next_to(circ, UP, buff=0.08)
             self.labels.add(lbl)
             self.add(circ, num, lbl)
             if i > 0:
@@ -111,37 +88,40 @@ class ProgressBar(VGroup):
 
 
 # ---------- Scene ----------
-class DrehungenV5(Scene):
+class DrehungenV5(LessonScene):
+    sections = ["Einstieg", "Definition", "Eigenschaften", "Drehung", "Bestimmung von Z, φ"]
+    keyframes = ["windrad", "abbildung_pqr", "winkel", "kongruenz", "fixpunkt", "drehung_45", "mittelsenkrechten",
+                 "drehwinkel"]
+
     def construct(self):
         config.tex_template.add_to_preamble(r"\usepackage{mathtools}")
-        sections = ["Einstieg", "Definition", "Eigenschaften", "Drehung", "Bestimmung von Z, φ"]
         # progress bar appears AFTER title and with smaller labels above circles
-        prog = ProgressBar(sections)
+        prog = ProgressBar(self.sections)
         self.play(FadeIn(prog))
-        prog.set_progress(0)
+        self.begin_section(prog, 0)
         self.add(prog)
+        self.set_static_layer(prog)
 
         # ---------- 1) Einstieg: centered windmill (3 triangular blades) ----------
-        prog.set_progress(0)
-        blades, center = make_windmill_three(radius=1.6, color=BLUE)
+        self.begin_section(prog, 0)
+        blades = Windmill(3, radius=1.6, color=BLUE)
+        center = Dot(ORIGIN, color=YELLOW)
         mast = Line(DOWN * 3, center.get_center() + DOWN / 3, color=WHITE, stroke_width=12)
         self.play(FadeIn(mast), Create(blades), FadeIn(center))
         self.wait(0.5)
         self.play(Rotate(blades, angle=450 * DEGREES, about_point=center.get_center()), run_time=3)  # PI/2
+        self.checkpoint("windrad")
         self.wait(0.5)
         self.play(FadeOut(mast), run_time=0.5)
         self.wait(0.5)
 
         # ---------- 2) Schreibweise ----------
-        prog.set_progress(1)
+        self.begin_section(prog, 1)
         # choose top blade and its exact tip (so P is truly the blade-tip)
-        tips = []
-        for blade in blades:
-            verts = blade.get_vertices()
-            tip = max(verts, key=lambda v: v[1])
-            tips.append((blade, tip))
+        verts = blades.get_blade_vertices()
         # pick blade with largest y tip (top blade)
-        blade0, tip_coords = max(tips, key=lambda bt: bt[1][1])
+        top = np.argmax(verts[:, :, 1].max(axis=1))
+        tip_coords = max(verts[top], key=lambda v: v[1])
 
         # Create copies for the "original" (left behind) elements:
         P_orig = Cross(Dot(tip_coords), stroke_width=2, stroke_color=BLUE)
@@ -156,9 +136,9 @@ class DrehungenV5(Scene):
 
         # Now hide the full blades but keep a copy of the top blade we will transform later
         # Save the exact top-blade geometry to re-use as tri_orig
-        tri_orig = blade0.copy()  # exact triangle of blade0
+        tri_orig = blades.get_blade(top)  # exact triangle of the top blade
         # Hide all blades visually
-        self.play(*[FadeOut(b) for b in blades], run_time=0.5)
+        self.play(FadeOut(blades), run_time=0.5)
         self.wait(0.5)
         self.play(Create(line_orig))
         self.wait(0.5)
@@ -242,6 +222,7 @@ class DrehungenV5(Scene):
         notation = MathTex(r"PQR \xmapsto{Z;\ \varphi = -120^\circ} P'Q'R'", color=ORANGE).scale(1.0).move_to(
             DOWN * 3)
         self.play(Write(notation))
+        self.checkpoint("abbildung_pqr")
         self.wait(0.5)
         self.play(FadeOut(P_move, Q_move, R_move, P_orig, R_dot, Q_dot, Z, Pp_label2, Qp_label2, Rp_label2, Q_label2,
                           R_label2, P_orig_label), run_time=0.5)
@@ -272,13 +253,14 @@ class DrehungenV5(Scene):
         phi_right_new = MathTex(r"\varphi < 0", color=ORANGE).scale(0.9).move_to(phi_right)
 
         self.play(Transform(phi_left, phi_left_new), Transform(phi_right, phi_right_new))
+        self.checkpoint("winkel")
         self.wait(0.5)
         self.play(FadeOut(left_arc, right_arc, left_tip, right_tip, phi_left_new, phi_right_new, phi_right, phi_left,
                           notation, Z, center), run_time=0.5)
         self.wait(0.5)
 
         # ---------- 3) Eigenschaften: (tri_orig is the image, tri_ur is the preimage) ----------
-        prog.set_progress(2)
+        self.begin_section(prog, 2)
 
         self.play(tri_move.animate.rotate(120 * DEGREES, about_point=tri_move.get_center()))
         self.play(
@@ -288,38 +270,36 @@ class DrehungenV5(Scene):
         self.play(FadeToColor(tri_orig, (GREEN + BLUE)), FadeToColor(tri_move, (GREEN + BLUE)))
         self.wait(0.5)
 
-        kong_text = Text("Kongruenzabbildung: Urfigur und Bildfigur sind deckungsgleich", color=ORANGE,
-                         font_size=28).move_to(DOWN * 3)
+        kong_text = cached_text("Kongruenzabbildung: Urfigur und Bildfigur sind deckungsgleich", color=ORANGE,
+                                font_size=28).move_to(DOWN * 3)
         self.play(Write(kong_text))
+        self.checkpoint("kongruenz")
         self.wait(0.5)
         self.play(FadeOut(kong_text, tri_orig, tri_move), run_time=0.5)
         self.wait(0.5)
 
         # Fixpunkt: assemble full windmill centrally and rotate it; remove P',Q',R' first (as requested)
-        prog.set_progress(2)
-        wind_centered, center_dot = make_windmill_three(radius=1.6, color=BLUE)
-        # wind_centered is a VGroup of triangles; center_dot is Dot
+        self.begin_section(prog, 2)
+        wind_centered = Windmill(3, radius=1.6, color=BLUE)
+        center_dot = Dot(ORIGIN, color=YELLOW)
         self.play(Create(wind_centered), FadeIn(center_dot))
         self.wait(0.5)
         self.play(Rotate(wind_centered, angle=360 * DEGREES, about_point=center_dot.get_center()), run_time=2)
         self.wait(0.5)
-        fix_text = Text("Drehzentrum Z ist einziger Fixpunkt", font_size=26, color=ORANGE).move_to(DOWN * 3)
+        fix_text = cached_text("Drehzentrum Z ist einziger Fixpunkt", font_size=26, color=ORANGE).move_to(DOWN * 3)
         self.play(Write(fix_text))
+        self.checkpoint("fixpunkt")
         self.wait(0.5)
 
         # ---------- 4) Drehung durchführen ----------
-        prog.set_progress(3)
+        self.begin_section(prog, 3)
         # clean up the items from (3) to avoid conflicts
         self.play(FadeOut(wind_centered, center_dot, fix_text), run_time=0.5)
         self.wait(0.5)
 
-        plane = NumberPlane(
-            x_range=[-6, 6, 1],
-            y_range=[-3, 4, 1],
-            background_line_style={"stroke_color": GREY, "stroke_width": 1, "stroke_opacity": 0.35},
-            axis_config={"stroke_color": GREY_B, "stroke_width": 2, "stroke_opacity": 0.8, "include_tip": True},
-        ).add_coordinates(font_size=20, stroke_width=1, num_decimal_places=0).scale(0.95)
+        plane = cached_plane()
         self.play(Create(plane))
+        self.set_static_layer(prog, plane)
         self.wait(0.5)
 
         final_not = MathTex(r"P \xmapsto{Z;\ \varphi = 45^\circ} P'").scale(1.0).move_to(2 * RIGHT + 2 * DOWN)
@@ -357,25 +337,22 @@ class DrehungenV5(Scene):
                     stroke_color=GREEN)
         P4p_label = MathTex("P`", color=GREEN).next_to(P4p, UP, buff=0.08)
         self.play(FadeIn(P4p, P4p_label))
+        self.checkpoint("drehung_45")
         self.wait(0.5)
         self.play(FadeOut(P4, P4p, P4p_label, Z4, arc4, line_hint, P4_label, Z4_label, final_not), run_time=0.5)
         self.wait(0.5)
 
         # ---------- 5) Bestimmung: Mittelsenkrechten + Kreissektoren ----------
-        prog.set_progress(4)
+        self.begin_section(prog, 4)
         # clear these demo dots but keep axes
         Z_dot = Cross(Dot(plane.coords_to_point(0.5, -0.3)), stroke_width=2, stroke_color=YELLOW)
         Z_label = MathTex("Z", color=YELLOW).next_to(Z_dot, LEFT, buff=0.08)
         phi_val = 75 * DEGREES
-        P5 = Cross(Dot(plane.coords_to_point(1, -0.5)), stroke_width=2, stroke_color=BLUE)
-        Q5 = Cross(Dot(plane.coords_to_point(3, -1)), stroke_width=2, stroke_color=BLUE)
-        R5 = Cross(Dot(plane.coords_to_point(3, 0)), stroke_width=2, stroke_color=BLUE)
-        P5p_coords = rotate_point(P5.get_center(), phi_val, about=Z_dot.get_center())
-        Q5p_coords = rotate_point(Q5.get_center(), phi_val, about=Z_dot.get_center())
-        R5_coords = rotate_point(R5.get_center(), phi_val, about=Z_dot.get_center())
-        P5p = Cross(Dot(P5p_coords), stroke_width=2, stroke_color=GREEN)
-        Q5p = Cross(Dot(Q5p_coords), stroke_width=2, stroke_color=GREEN)
-        R5p = Cross(Dot(R5_coords), stroke_width=2, stroke_color=GREEN)
+        # P, Q, R (0-2) und P', Q', R' (3-5) in einer Markierungswolke
+        pqr = np.array([plane.coords_to_point(1, -0.5), plane.coords_to_point(3, -1), plane.coords_to_point(3, 0)])
+        pts5 = MarkerCloud(np.vstack([pqr, rotate_points(pqr, phi_val, about=Z_dot.get_center())]),
+                           color=[BLUE] * 3 + [GREEN] * 3, stroke_width=2)
+        P5, Q5, R5, P5p, Q5p, R5p = (pts5.marker(i) for i in range(6))
         labels5 = VGroup(
             MathTex("P").next_to(P5, DOWN, buff=0.05),
             MathTex("P'").next_to(P5p, UR, buff=0.05),
@@ -384,25 +361,24 @@ class DrehungenV5(Scene):
             MathTex("R").next_to(R5, RIGHT, buff=0.05),
             MathTex("R'").next_to(R5p, UR, buff=0.05),
         )
-        tri = Polygon(P5.get_center(), Q5.get_center(), R5.get_center(), color=BLUE, fill_opacity=0.4)
-        trip = Polygon(P5p.get_center(), Q5p.get_center(), R5p.get_center(), color=GREEN, fill_opacity=0.4)
-        self.play(FadeIn(P5, Q5, R5), FadeIn(P5p, Q5p, R5p), FadeIn(tri, trip), Write(labels5))
+        tri = Polygon(*pts5.get_positions()[:3], color=BLUE, fill_opacity=0.4)
+        trip = Polygon(*pts5.get_positions()[3:], color=GREEN, fill_opacity=0.4)
+        self.play(FadeIn(pts5), FadeIn(tri, trip), Write(labels5))
         self.wait(0.5)
 
         # Mittelsenkrechten
-        pgroup = VGroup(P5, P5p)
         m1 = perp_bisector_points(P5.get_center(), P5p.get_center(), length=5)
         m2 = perp_bisector_points(R5.get_center(), R5p.get_center(), length=5)
-        self.play(Indicate(pgroup, scale_factor=1.2, color=RED), Create(m1), run_time=0.5)
+        self.play(IndicateMarkers(pts5, [0, 3], scale_factor=1.2, color=RED), Create(m1), run_time=0.5)
         self.wait(0.5)
-        qgroup = VGroup(R5, R5p)
-        self.play(Indicate(qgroup, scale_factor=1.2, color=RED), Create(m2), run_time=0.5)
+        self.play(IndicateMarkers(pts5, [2, 5], scale_factor=1.2, color=RED), Create(m2), run_time=0.5)
         self.wait(0.5)
         self.play(FadeIn(Z_dot), Write(Z_label))
+        self.checkpoint("mittelsenkrechten")
         self.wait(0.5)
 
         tri_cooy = tri.copy()
-        rot_group = VGroup(P5, Q5, R5).copy()
+        rot_group = VGroup(pts5.copy_markers([0, 1, 2]))
         rot_group.add(tri_cooy)
         self.play(Rotate(rot_group, about_point=Z_dot.get_center(), angle=phi_val))
         self.wait(0.5)
@@ -430,6 +406,7 @@ class DrehungenV5(Scene):
             Z_dot.get_center())
 
         self.play(Create(arc))
+        self.checkpoint("drehwinkel")
         self.wait(2)
 
 # manim -pqh .\drehungen.py DrehungenV5
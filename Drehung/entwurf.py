@@ -0,0 +1,184 @@
+"""
+Entwurfsmodus für schnelle Vorschauen der Choreographie.
+
+    python entwurf.py vektoren.py VektorenV6            # oder: LEKTION_DRAFT=1 manim -ql ...
+    python entwurf.py punktspiegelung.py PunktspiegelungV4 -s 2
+
+Im Entwurf
+  - läuft kein LaTeX und kein Pango: MathTex/Text bestehen aus Kästchen (eines je Glyph).
+    Liegt die echte Formel schon im tex_dir, bekommen die Kästchen deren Abmessungen, sonst
+    werden sie aus der Zeichenzahl geschätzt. Texte aus cached_text kommen weiter aus dem Cache.
+  - hat das Koordinatengitter nur jede zweite Linie (und Beschriftung),
+  - werden Bögen/Kreise mit weniger Bézier-Segmenten und Kurven mit weniger Stützpunkten gebaut,
+  - wird mit DRAFT_CONFIG (240p, 10 fps) nach media/entwurf gerendert.
+Lagen, Größen und Zeiten bleiben wie im fertigen Video. Gilt für alle Szenen mit DraftMixin
+(LessonScene und Intro).
+"""
+import argparse
+import functools
+import hashlib
+import os
+import re
+import subprocess
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim import Arc, Text, config
+from manim.mobject.text.text_mobject import START_X, START_Y, TEXT2SVG_ADJUSTMENT_FACTOR
+from manim.utils import tex_file_writing
+
+HERE = Path(__file__).resolve().parent
+DRAFT_ENV = "LEKTION_DRAFT"
+DRAFT_CONFIG = {"pixel_width": 426, "pixel_height": 240, "frame_rate": 10}
+ARC_COMPONENTS = 3
+PLACEHOLDER_DIR = Path(tempfile.gettempdir()) / "lektion_entwurf"
+
+_installed = False
+
+
+def draft_enabled():
+    return bool(os.environ.get(DRAFT_ENV))
+
+
+def glyph_count(expression):
+    # ein Kästchen je (möglichem) Glyph - lieber zu viele als zu wenige Teilobjekte
+    return max(1, len(re.findall(r"\\[a-zA-Z]+|[^\s{}^_&\\]", expression)))
+
+
+def _write_placeholder(svg):
+    path = PLACEHOLDER_DIR / f"{hashlib.sha1(svg.encode()).hexdigest()[:16]}.svg"
+    if not path.exists():
+        PLACEHOLDER_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(svg)
+        tmp.replace(path)
+    return path
+
+
+def _cached_tex_root(expression, environment, tex_template):
+    """Attribute width/height/viewBox der echten Formel, falls sie schon übersetzt wurde."""
+    tex_template = tex_template or config["tex_template"]
+    if environment:
+        code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    else:
+        code = tex_template.get_texcode_for_expression(expression)
+    svg = config.get_dir("tex_dir") / f"{tex_file_writing.tex_hash(code)}.svg"
+    if not svg.exists():
+        return None
+    with open(svg, "rb") as f:
+        _, root = next(ET.iterparse(f, events=("start",)))
+    return {k: root.get(k) for k in ("width", "height", "viewBox")}
+
+
+def placeholder_svg(expression, environment=None, tex_template=None):
+    """Ersatz für tex_to_svg_file: Kästchen in der Größe der echten Formel (oder geschätzt)."""
+    n = glyph_count(expression)
+    root = _cached_tex_root(expression, environment, tex_template)
+    if root and root["viewBox"]:
+        x, y, w, h = map(float, root["viewBox"].split())
+        size = f'width="{root["width"]}" height="{root["height"]}" viewBox="{root["viewBox"]}"'
+    else:
+        x, y, w, h = 0, -8, 6 * n, 10
+        size = f'width="{w}pt" height="{h}pt" viewBox="{x} {y} {w} {h}"'
+    step = w / n
+    boxes = "".join(f'<path d="M{x + i * step + 0.1 * step} {y + 0.15 * h}h{0.8 * step}v{0.7 * h}h{-0.8 * step}z"/>'
+                    for i in range(n))
+    return _write_placeholder(f'<svg xmlns="http://www.w3.org/2000/svg" {size}>{boxes}</svg>')
+
+
+def placeholder_text_svg(text, color):
+    """Ersatz für Text._text2svg: ein Kästchen je sichtbarem Zeichen, Laufweite geschätzt."""
+    size = text._font_size / TEXT2SVG_ADJUSTMENT_FACTOR
+    line_spacing = text.line_spacing / TEXT2SVG_ADJUSTMENT_FACTOR
+    boxes = []
+    for row, line in enumerate(text.text.split("\n")):
+        top = START_Y + row * line_spacing + 0.25 * size
+        for col, char in enumerate(line):
+            if not char.isspace():
+                boxes.append(f'<path d="M{START_X + col * 0.55 * size} {top}h{0.45 * size}v{0.7 * size}'
+                             f'h{-0.45 * size}z"/>')
+    w, h = config.pixel_width, config.pixel_height
+    return str(_write_placeholder(f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}pt" height="{h}pt" '
+                                  f'viewBox="0 0 {w} {h}" fill="{color}">{"".join(boxes)}</svg>'))
+
+
+def draft_plane_config(plane_config):
+    """Nur jede zweite Gitterlinie (und damit Koordinate)."""
+    plane_config = dict(plane_config)
+    for key in ("x_range", "y_range"):
+        lo, hi, step = plane_config[key]
+        plane_config[key] = [lo, hi, 2 * step]
+    return plane_config
+
+
+def curve_samples(n):
+    """Stützpunkte für vorberechnete Kurven (z.B. EpicycleTrail): im Entwurf ein Zehntel."""
+    return max(n // 10, 50) if draft_enabled() else n
+
+
+def install():
+    """
+    Entwurfsmodus für die nächste Szene (nur mit LEKTION_DRAFT), vor Kamera und FileWriter aufrufen.
+    Die Auflösung wird bei jeder Szene gesetzt, da tempconfig (stills.py, section_cache.py) config
+    danach zurücksetzt; die Platzhalter für TeX/Text/Bögen werden einmal je Prozess eingehängt.
+    """
+    if not draft_enabled():
+        return
+    for key, value in DRAFT_CONFIG.items():
+        config[key] = value
+    _patch()
+
+
+def _patch():
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    # tex_prepass ersetzt tex_to_svg_file selbst - dann nicht überschreiben
+    if tex_mobject.tex_to_svg_file is tex_file_writing.tex_to_svg_file:
+        tex_mobject.tex_to_svg_file = placeholder_svg
+    Text._text2svg = placeholder_text_svg
+
+    arc_init = Arc.__init__
+
+    @functools.wraps(arc_init)
+    def draft_arc_init(self, *args, **kwargs):
+        if len(args) < 4:
+            kwargs.setdefault("num_components", ARC_COMPONENTS)
+        arc_init(self, *args, **kwargs)
+
+    Arc.__init__ = draft_arc_init
+
+
+class DraftMixin:
+    """
+    Vor Scene in die Basisklassen setzen (LessonScene tut das bereits), z.B.
+        class Intro(DraftMixin, ProfilingMixin, Scene)
+    Ruft install() einmal je Szene auf - in __new__, also vor jedem __init__ und damit vor
+    Renderer und Kamera (LessonScene baut beide schon in seinem __init__).
+    """
+
+    def __new__(cls, *args, **kwargs):
+        install()
+        return super().__new__(cls)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-s", "--sections", default="", help='nur diese ProgressBar-Abschnitte, z.B. "2" oder "0,3"')
+    parser.add_argument("-p", "--preview", action="store_true", help="Video danach öffnen")
+    args = parser.parse_args()
+
+    from lektion import SECTIONS_ENV
+
+    env = dict(os.environ, **{DRAFT_ENV: "1", SECTIONS_ENV: args.sections})
+    c = DRAFT_CONFIG
+    cmd = ["manim", "render", "-r", f"{c['pixel_width']},{c['pixel_height']}", "--fps", str(c["frame_rate"]),
+           "--media_dir", str(HERE / "media" / "entwurf"), str(HERE / args.file), args.scene]
+    if args.preview:
+        cmd.insert(2, "-p")
+    subprocess.run(cmd, cwd=HERE, env=env, check=True)
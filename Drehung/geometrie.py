@@ -0,0 +1,222 @@
+import numpy as np
+
+# ---------- exakte Winkel ----------
+# Vielfache von 15° (90°, 120°, 180°, ...) kommen ständig vor. Ihre cos/sin-Werte stehen in
+# einer Tabelle, die aus den exakten Werten im ersten Quadranten per Vierteldrehung
+# (c, s) -> (-s, c) aufgebaut ist: cos(120°) ist dann genau -0.5, cos(90°) genau 0 usw.,
+# und dieselbe Drehung liefert immer bitgleiche Punkte.
+STEPS = 24  # 15°-Raster
+_Q1 = np.array([1.0, (np.sqrt(6) + np.sqrt(2)) / 4, np.sqrt(3) / 2, np.sqrt(2) / 2, 0.5,
+                (np.sqrt(6) - np.sqrt(2)) / 4, 0.0])  # cos(0°), cos(15°), ..., cos(90°)
+COS_TABLE = np.empty(STEPS)
+SIN_TABLE = np.empty(STEPS)
+for _k in range(STEPS):
+    _q, _r = divmod(_k, 6)
+    _c, _s = _Q1[_r], _Q1[6 - _r]
+    for _ in range(_q):
+        _c, _s = 0.0 - _s, _c  # kein -0.0
+    COS_TABLE[_k], SIN_TABLE[_k] = _c, _s
+SNAP_TOL = 1e-9
+
+
+def cos_sin(angle):
+    """cos und sin (Radiant, Skalar oder Array); Vielfache von 15° exakt aus der Tabelle."""
+    angle = np.asarray(angle, dtype=float)
+    k = angle * (STEPS / (2 * np.pi))
+    kr = np.round(np.where(np.isfinite(k), k, 0))  # NaN/inf: nie einrasten, np.cos/np.sin wie sonst
+    snap = np.abs(k - kr) < SNAP_TOL
+    idx = kr.astype(np.int64) % STEPS if angle.ndim else int(kr) % STEPS
+    if angle.ndim == 0:
+        return (COS_TABLE[idx], SIN_TABLE[idx]) if snap else (np.cos(angle), np.sin(angle))
+    c = np.where(snap, COS_TABLE[idx], np.cos(angle))
+    s = np.where(snap, SIN_TABLE[idx], np.sin(angle))
+    return c, s
+
+
+def quarter_turns(angle):
+    """Anzahl Vierteldrehungen (0..3), falls angle ein Vielfaches von 90° ist, sonst None."""
+    k = float(angle) * (4 / (2 * np.pi))
+    if not np.isfinite(k):
+        return None
+    kr = round(k)
+    return kr % 4 if abs(k - kr) < SNAP_TOL * 4 / STEPS else None
+
+
+# ---------- Drehungen ----------
+def rotate_points(points, angle, about=(0, 0, 0), out=None):
+    """
+    Dreht viele Punkte auf einmal um `about` (gegen den Uhrzeigersinn, Radiant).
+
+    points: (N,2) oder (N,3) bzw. ein einzelner Punkt (2,) / (3,)
+    angle:  Skalar oder (N,) - ein Winkel je Punkt
+    about:  (2,) / (3,) oder (N,2) / (N,3) - ein Zentrum je Punkt
+    out:    optionaler Puffer in der Form von `points` (darf `points` selbst sein)
+
+    Eine z-Koordinate wird unverändert übernommen. Vielfache von 90° werden exakt durch
+    Vertauschen und Vorzeichen gerechnet, andere Vielfache von 15° mit exakten Tabellenwerten.
+    """
+    pts = np.asarray(points, dtype=float)
+    single = pts.ndim == 1
+    pts = np.atleast_2d(pts)
+    if out is None:
+        out = np.empty_like(pts)
+    res = np.atleast_2d(out)
+
+    about = np.asarray(about, dtype=float)
+    ab = about[..., :2]
+    d = pts[:, :2] - ab  # einziges Zwischen-Array (N,2)
+
+    angle = np.asarray(angle, dtype=float)
+    q = quarter_turns(angle) if angle.ndim == 0 else None
+    if q is not None:
+        # Vierteldrehungen ohne Arithmetik: (x,y) -> (-y,x), (-x,-y), (y,-x) wie in VektorenV6
+        x, y = d[:, 0], d[:, 1]
+        if q == 0:
+            res[:, 0], res[:, 1] = x, y
+        elif q == 1:
+            np.negative(y, out=res[:, 0])
+            res[:, 1] = x
+        elif q == 2:
+            np.negative(d, out=res[:, :2])
+        else:
+            res[:, 0] = y
+            np.negative(x, out=res[:, 1])
+        res[:, :2] += ab
+        if pts.shape[1] > 2 and res is not pts:
+            res[:, 2:] = pts[:, 2:]
+        return res[0] if single else out
+
+    c, s = cos_sin(angle)
+    if angle.ndim == 0:
+        # ein Winkel für alle Punkte: eine Matrixmultiplikation
+        np.matmul(d, np.array([[c, s], [-s, c]]), out=res[:, :2])
+    else:
+        np.multiply(d[:, 0], c, out=res[:, 0])
+        res[:, 0] -= d[:, 1] * s
+        np.multiply(d[:, 0], s, out=res[:, 1])
+        res[:, 1] += d[:, 1] * c
+    res[:, :2] += ab
+    if pts.shape[1] > 2 and res is not pts:
+        res[:, 2:] = pts[:, 2:]
+    return res[0] if single else out
+
+
+def rotate_point(pt, angle, about=(0, 0, 0)):
+    """Einzelpunkt-Variante für Szenen; liefert immer einen 3D-Punkt (Manim)."""
+    pt = np.asarray(pt, dtype=float)
+    if pt.shape[0] == 2:
+        pt = np.append(pt, 0.0)
+    return rotate_points(pt, angle, about)
+
+
+# ---------- Drehung aus Punktpaaren ----------
+def rotation_from_pairs(originals, images):
+    """
+    Bestimmt Drehzentrum und Drehwinkel vieler Figuren auf einmal aus Punktpaaren P -> P'.
+
+    originals, images: (F,K,2) / (F,K,3) - F Figuren mit je K Punkten (oder (K,2) für eine Figur)
+    Rückgabe: centres (F,2), angles (F,) in (-pi, pi], residuals (F,)
+
+    Winkel und Zentrum sind die Kleinste-Quadrate-Lösung (ohne Streckung und Spiegelung):
+    der Winkel aus den schwerpunktzentrierten Punkten, das Zentrum aus (I - R)·Z = S' - R·S.
+    residuals ist der mittlere Abstand zwischen gedrehten Punkten und Bildpunkten; deutlich
+    größer als 0 heißt: keine Drehung. Bei Winkel 0 (Verschiebung/Identität) ist das Zentrum nan.
+    """
+    a = np.asarray(originals, dtype=float)[..., :2]
+    b = np.asarray(images, dtype=float)[..., :2]
+    single = a.ndim == 2
+    if single:
+        a, b = a[None], b[None]
+
+    sa, sb = a.mean(axis=1), b.mean(axis=1)  # Schwerpunkte (F,2)
+    da, db = a - sa[:, None], b - sb[:, None]
+    dot = np.einsum("fki,fki->f", da, db)
+    cross = np.sum(da[..., 0] * db[..., 1] - da[..., 1] * db[..., 0], axis=1)
+    angles = np.arctan2(cross, dot)
+    c, s = cos_sin(angles)
+
+    residuals = np.sqrt(np.mean(np.sum((rotate_points(da.reshape(-1, 2), np.repeat(angles, a.shape[1]))
+                                        .reshape(da.shape) - db) ** 2, axis=2), axis=1))
+
+    # (I - R)·Z = S' - R·S, geschlossen gelöst: det(I - R) = 2 - 2cos
+    rhs = sb - np.stack([c * sa[:, 0] - s * sa[:, 1], s * sa[:, 0] + c * sa[:, 1]], axis=1)
+    det = 2 - 2 * c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centres = np.stack([(1 - c) * rhs[:, 0] - s * rhs[:, 1], s * rhs[:, 0] + (1 - c) * rhs[:, 1]], axis=1)
+        centres /= det[:, None]
+    centres[det < 1e-12] = np.nan
+
+    if single:
+        return centres[0], angles[0], residuals[0]
+    return centres, angles, residuals
+
+
+# ---------- Drehsymmetrie ----------
+def _cyclic_period(features, tol):
+    """Kleinste Periode p (Teiler von N) einer zyklischen Folge von Merkmalen (N,k); KMP, O(N)."""
+    seq = [tuple(f) for f in np.asarray(features).tolist()]
+    n = len(seq)
+
+    def same(x, y):
+        return all(abs(u - v) <= tol for u, v in zip(x, y))
+
+    fail = [0] * n
+    k = 0
+    for i in range(1, n):
+        while k and not same(seq[i], seq[k]):
+            k = fail[k - 1]
+        if same(seq[i], seq[k]):
+            k += 1
+        fail[i] = k
+    p = n - fail[-1] if n else 1
+    return p if p and n % p == 0 else n
+
+
+def _wrap(angles):
+    return (angles + np.pi) % (2 * np.pi) - np.pi
+
+
+def rotational_symmetry(figure, tol=1e-6):
+    """
+    Ordnung, Zentrum und kleinster Drehwinkel der Drehsymmetrie einer Figur.
+
+    figure: Ecken eines Polygons in Reihenfolge, (N,2) / (N,3), z.B. polygon.get_vertices(),
+            oder eine Liste solcher Arrays für eine Figur aus mehreren Teilen (z.B. Windrad-Flügel)
+    Rückgabe: order (1 = nur 360°), centre (2,), angle = 2*pi/order
+
+    Polygon: zyklische Folge aus Kantenlänge und Knickwinkel je Ecke. Teilfiguren: alle Ecken
+    nach Polarwinkel um den Schwerpunkt sortiert, Folge aus Radius und Winkelabstand.
+    Die kleinste Periode p der Folge (KMP) liefert order = N / p, ohne Probedrehungen.
+    """
+    parts = [np.asarray(figure, dtype=float)] if np.ndim(figure) == 2 else \
+        [np.asarray(f, dtype=float) for f in figure]
+    parts = [p[:, :2] for p in parts]
+    pts = np.concatenate(parts)
+
+    if len(parts) == 1:
+        v = parts[0]
+        edges = np.roll(v, -1, axis=0) - v
+        keep = np.hypot(edges[:, 0], edges[:, 1]) > tol  # doppelte Ecken ignorieren
+        v, edges = v[keep], edges[keep]
+        # Schwerpunkt erst ohne doppelte Ecken (sonst zählt z.B. die wiederholte Startecke doppelt)
+        centre = v.mean(axis=0) if len(v) else pts.mean(axis=0)
+        lengths = np.hypot(edges[:, 0], edges[:, 1])
+        heading = np.arctan2(edges[:, 1], edges[:, 0])
+        turning = _wrap(np.roll(heading, -1) - heading)
+        features = np.stack([lengths / lengths.mean(), turning], axis=1)
+    else:
+        centre = pts.mean(axis=0)
+        d = pts - centre
+        r = np.hypot(d[:, 0], d[:, 1])
+        scale = r.max()
+        keep = r > tol * scale  # Punkte im Zentrum liegen auf sich selbst
+        r, theta = r[keep] / scale, np.arctan2(d[keep, 1], d[keep, 0])
+        order = np.lexsort((r, np.round(theta / tol)))
+        r, theta = r[order], theta[order]
+        gaps = np.diff(theta, append=theta[0] + 2 * np.pi)
+        features = np.stack([r, gaps], axis=1)
+
+    if len(features) == 0:
+        return 1, centre, 2 * np.pi
+    order = len(features) // _cyclic_period(features, tol * 10)
+    return order, centre, 2 * np.pi / order
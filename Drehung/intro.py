@@ -1,10 +1,70 @@
 from manim import *
 import numpy as np
 
+from abhaengigkeiten import when_changed
+from entwurf import DraftMixin, curve_samples
+from profiler import ProfilingMixin
+
 config.background_color = "#0e0e0e"
 
 
-class Intro(Scene):
+class EpicycleTrail(VMobject):
+    """
+    Spur der Spitze einer Epizykel-Kette  z(t) = Σ R_k·e^{i(ω_k·t + φ_k)}  (beliebig viele Kreise).
+    Der ganze Pfad wird einmal vektorisiert vorberechnet; pro Frame wird nur ein Fenster
+    fester Länge in einen vorab angelegten Puffer kopiert - der Aufwand bleibt konstant,
+    egal wie lange die Animation läuft.
+    """
+
+    def __init__(self, tracker, radii, freqs, phases=None, t_range=(0, 1), samples=2000,
+                 window=None, center=ORIGIN, **kwargs):
+        super().__init__(**kwargs)
+        self.tracker = tracker
+        self.radii = np.asarray(radii, dtype=float)
+        self.freqs = np.asarray(freqs, dtype=float)
+        self.phases = np.zeros_like(self.radii) if phases is None else np.asarray(phases, dtype=float)
+        self.center = np.array(center, dtype=float)
+        self.t0, t1 = t_range
+        samples = curve_samples(samples)
+        self.dt = (t1 - self.t0) / (samples - 1)
+        self.path = self.joints_at(np.linspace(self.t0, t1, samples))[:, -1]
+
+        # Fenster (in Einheiten von t) -> feste Anzahl Stützpunkte
+        n_window = samples if window is None else int(round(window / self.dt)) + 1
+        self.offsets = np.arange(-n_window + 1, 1)
+        self.idx = np.empty(n_window, dtype=int)
+        self.buffer = np.empty((n_window + 1, 3))
+
+        self.update_trail()
+        self.add_updater(when_changed(lambda m: m.update_trail(), tracker))
+
+    def joints_at(self, t):
+        """Gelenke der Kette für alle t auf einmal: (len(t), Anzahl Kreise + 1, 3), Gelenk 0 = Zentrum."""
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        z = self.radii * np.exp(1j * (np.outer(t, self.freqs) + self.phases))
+        z = np.cumsum(np.hstack([np.zeros((len(t), 1)), z]), axis=1)
+        pts = np.empty(z.shape + (3,))
+        pts[..., 0] = z.real + self.center[0]
+        pts[..., 1] = z.imag + self.center[1]
+        pts[..., 2] = self.center[2]
+        return pts
+
+    def get_joint(self, k):
+        return self.joints_at(self.tracker.get_value())[0, k]
+
+    def update_trail(self):
+        t = self.tracker.get_value()
+        i = int(np.clip((t - self.t0) / self.dt, 0, len(self.path) - 1))
+        # Fenster [i - n + 1, i]; vor dem Start wird der erste Punkt wiederholt
+        np.add(self.offsets, i, out=self.idx)
+        np.maximum(self.idx, 0, out=self.idx)
+        np.take(self.path, self.idx, axis=0, out=self.buffer[:-1])
+        self.buffer[-1] = self.joints_at(t)[0, -1]
+        self.set_points_as_corners(self.buffer)
+        return self
+
+
+class Intro(DraftMixin, ProfilingMixin, Scene):
     def construct(self):
         # Mittelpunkt
         center = Dot(ORIGIN, color=YELLOW)
@@ -19,42 +79,29 @@ class Intro(Scene):
         p2 = Dot([0, R1 + R2, 0], color=RED)
         self.add(p1, p2)
 
-        # Tracker für die Winkel
-        angle1 = ValueTracker(0)
-        angle2 = ValueTracker(0)
-
-        # Updater für p1 (rotierend um Zentrum)
-        p1.add_updater(lambda m: m.move_to(
-            ORIGIN + R1 * np.array([
-                np.cos(angle1.get_value()),
-                np.sin(angle1.get_value()), 0
-            ])
-        ))
-
-        # Updater für p2 (rotierend um p1)
-        p2.add_updater(lambda m: m.move_to(
-            p1.get_center() + R2 * np.array([
-                np.cos(angle2.get_value()),
-                np.sin(angle2.get_value()), 0
-            ])
-        ))
-
-        # Farbverlauf-Trail (Verlauf von Blau → Pink)
-        trail = TracedPath(
-            p2.get_center,
+        # Parameter t läuft von 0 bis 1: p1 umrundet das Zentrum einmal,
+        # p2 umrundet p1 dabei viermal rückwärts ("Doppelrotationseffekt")
+        t = ValueTracker(0)
+
+        # Farbverlauf-Trail (Verlauf von Blau → Pink), geschlossen berechnet
+        trail = EpicycleTrail(
+            t,
+            radii=[R1, R2],
+            freqs=[2 * PI, -8 * PI],
             stroke_color=[BLUE, PURPLE, PINK],
             stroke_width=5,
-            dissipating_time=24  # ,   # langsam ausblenden, damit Verlauf bleibt
-            # min_distance_to_new_point=0.01
         )
 
+        # p1 und p2 sitzen auf den Gelenken der Epizykel-Kette (Updater nur, wenn t sich ändert)
+        p1.add_updater(when_changed(lambda m: m.move_to(trail.get_joint(1)), t))
+        p2.add_updater(when_changed(lambda m: m.move_to(trail.get_joint(2)), t))
+
         self.add(trail)
 
         # Animation starten
         title = Text("Drehsymmetrische Figuren", color=YELLOW).scale(1.2).move_to(DOWN * 3)
         self.play(
-            angle1.animate.set_value(2 * PI),
-            angle2.animate.set_value(-8 * PI),  # schneller für "Doppelrotationseffekt"
+            t.animate.set_value(1),
             # Write(title),
             run_time=6.7,
             rate_func=linear
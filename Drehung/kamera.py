@@ -0,0 +1,81 @@
+from manim import *
+import zlib
+
+import cairo
+from manim.utils.family import extract_mobject_family_members
+
+
+def mobject_fingerprint(mobjects):
+    """Prüfsumme über Punkte, Farben und Strichbreiten - ändert sich bei jeder Mutation."""
+    crc = 0
+    for m in extract_mobject_family_members(mobjects):
+        for arr in (m.points, getattr(m, "fill_rgbas", None), getattr(m, "stroke_rgbas", None),
+                    getattr(m, "stroke_width", None)):
+            if arr is not None:
+                crc = zlib.crc32(np.ascontiguousarray(arr, dtype=float), crc)
+    return crc
+
+
+class StaticLayerCamera(Camera):
+    """
+    Cairo-Kamera mit einer statischen Hintergrundebene (z.B. NumberPlane und ProgressBar).
+    Die Ebene wird einmal in einen transparenten Pixelpuffer gerastert und danach in jedem
+    Frame nur noch per Cairo untergemischt. Wird eines ihrer Mobjects verändert (Punkte,
+    Farben, Strichbreite), rastert die Kamera den Puffer automatisch neu.
+    Die Ebene wird an der Stelle ihres untersten Mobjects in die Zeichenreihenfolge eingefügt.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.static_layer = []
+        self.layer_buffer = None
+        self.layer_surface = None
+        self.layer_key = None
+
+    def set_static_layer(self, *mobjects):
+        self.static_layer = list(mobjects)
+        self.layer_key = None
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        mobjects = list(mobjects)
+        # ganze Familien: Scene.get_moving_mobjects liefert flache Listen (auch Kreise, Beschriftungen,
+        # Gitterlinien der Ebene einzeln) - die stecken schon im Puffer und dürfen nicht nochmal gezeichnet werden
+        layer_ids = {id(m) for m in extract_mobject_family_members(self.static_layer)}
+        hits = [i for i, m in enumerate(mobjects) if id(m) in layer_ids]
+        if not hits or kwargs.get("excluded_mobjects"):
+            return super().capture_mobjects(mobjects, **kwargs)
+
+        present = {id(mobjects[i]) for i in hits}
+        layer = [m for m in self.static_layer if any(id(f) in present for f in m.get_family())]
+        first = hits[0]
+        super().capture_mobjects(mobjects[:first], **kwargs)
+        self.paint_layer(layer)
+        super().capture_mobjects([m for m in mobjects[first:] if id(m) not in layer_ids], **kwargs)
+
+    def paint_layer(self, layer):
+        key = (self.pixel_array.shape, tuple(self.frame_center), self.frame_width, self.frame_height,
+               mobject_fingerprint(layer))
+        if key != self.layer_key:
+            self.rasterize_layer(layer)
+            self.layer_key = key
+        ctx = self.get_cairo_context(self.pixel_array)
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.set_source_surface(self.layer_surface, 0, 0)
+        ctx.paint()
+        ctx.restore()
+        ctx.get_target().flush()
+
+    def rasterize_layer(self, layer):
+        if self.layer_buffer is None or self.layer_buffer.shape != self.pixel_array.shape:
+            self.layer_buffer = np.zeros_like(self.pixel_array)
+            h, w = self.layer_buffer.shape[:2]
+            self.layer_surface = cairo.ImageSurface.create_for_data(self.layer_buffer, cairo.FORMAT_ARGB32, w, h)
+        self.layer_buffer[:] = 0
+        # in den transparenten Puffer zeichnen statt ins Bild
+        pixel_array, self.pixel_array = self.pixel_array, self.layer_buffer
+        try:
+            super().capture_mobjects(layer)
+        finally:
+            self.pixel_array = pixel_array
+        self.layer_surface.mark_dirty()
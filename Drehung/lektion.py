@@ -0,0 +1,114 @@
+from manim import *
+from manim.utils.exceptions import EndSceneEarlyException
+import importlib
+import os
+import sys
+from pathlib import Path
+
+from abhaengigkeiten import updating_mobjects
+from ausgabe import LessonRenderer, StreamingFileWriter, streaming_enabled
+from entwurf import DraftMixin
+from kamera import StaticLayerCamera
+from profiler import ProfilingMixin
+from section_cache import section_hash
+
+HERE = Path(__file__).resolve().parent
+
+# Welche ProgressBar-Abschnitte gerendert werden, z.B. "2" oder "0,3" (leer = alle)
+SECTIONS_ENV = "LEKTION_SECTIONS"
+
+
+def selected_sections():
+    value = os.environ.get(SECTIONS_ENV, "").strip()
+    if not value:
+        return None
+    return {int(s) for s in value.split(",")}
+
+
+def load_scene_class(file, scene):
+    """Szenenklasse aus einer Datei in Drehung/ laden, z.B. ("drehungen.py", "DrehungenV5")."""
+    if str(HERE) not in sys.path:
+        sys.path.insert(0, str(HERE))
+    module = importlib.import_module(Path(file).stem)
+    return getattr(module, scene)
+
+
+def save_frame(scene, paths):
+    """Aktuelles Bild der Szene als PNG bzw. PDF (ohne Alphakanal) speichern."""
+    scene.renderer.update_frame(scene)
+    image = scene.camera.get_image()
+    for path in paths:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        (image if path.suffix == ".png" else image.convert("RGB")).save(path)
+
+
+class LessonScene(DraftMixin, ProfilingMixin, Scene):
+    """
+    Szene, deren Ablauf in die Abschnitte der ProgressBar gegliedert ist.
+    Jeder Abschnitt ist eine eigene Manim-Section; nicht ausgewählte Abschnitte
+    werden nur "durchgerechnet" (skip_animations), damit der Zustand beim Eintritt
+    in einen ausgewählten Abschnitt stimmt. So kann jeder Abschnitt in einem
+    eigenen Prozess gerendert werden (siehe render_parallel.py).
+    """
+    sections = []
+    # Checkpoints mit viel Inhalt (vor dem Aufräumen eines Abschnitts), Referenzbilder für referenz.py
+    keyframes = []
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("camera_class", StaticLayerCamera)
+        if kwargs.get("renderer") is None:
+            # Standbilder nur einmal rastern; optional ein Encoder für die ganze Szene (siehe ausgabe.py)
+            writer = {"file_writer_class": StreamingFileWriter} if streaming_enabled() else {}
+            kwargs["renderer"] = LessonRenderer(camera_class=kwargs["camera_class"],
+                                                skip_animations=kwargs.get("skip_animations", False), **writer)
+        super().__init__(**kwargs)
+
+    def set_static_layer(self, *mobjects):
+        """Markiert z.B. Koordinatensystem und ProgressBar als statischen Hintergrund (einmal gerastert)."""
+        if isinstance(self.camera, StaticLayerCamera):
+            self.camera.set_static_layer(*mobjects)
+
+    def get_moving_mobjects(self, *animations):
+        # wie Scene.get_moving_mobjects, aber Updater aus when_changed zählen nur,
+        # wenn sich eine ihrer Abhängigkeiten in diesem play() ändern kann
+        animation_mobjects = [anim.mobject for anim in animations]
+        mobjects = self.get_mobject_family_members()
+        updating = updating_mobjects(mobjects, animation_mobjects)
+        for i, mob in enumerate(mobjects):
+            if mob in animation_mobjects or id(mob) in updating or mob in self.foreground_mobjects:
+                return mobjects[i:]
+        return []
+
+    def setup(self):
+        super().setup()
+        self.section_idx = None
+        self.section_hashes = []
+        self.render_sections = selected_sections()
+        self.enter_section(0)
+
+    def enter_section(self, idx):
+        if idx == self.section_idx:
+            return
+        self.section_idx = idx
+        # Inhalts-Hash beim Eintritt (Code des Abschnitts + Zustand), siehe section_cache.py
+        self.section_hashes.append(section_hash(self, idx))
+        skip = self.render_sections is not None and idx not in self.render_sections
+        self.next_section(self.sections[idx], skip_animations=skip)
+
+    def begin_section(self, prog, idx):
+        """Ersetzt prog.set_progress(idx) am Anfang eines Abschnitts."""
+        self.enter_section(idx)
+        prog.set_progress(idx)
+
+    def checkpoint(self, name):
+        """
+        Benannter Zwischenstand einer Konstruktion (z.B. für Arbeitsblätter). Im Standbild-Modus
+        (stills.py) wird hier das aktuelle Bild gespeichert; sind alle angeforderten Standbilder
+        geschrieben, endet construct() vorzeitig. Sonst ohne Wirkung.
+        """
+        stills = getattr(self, "stills", None)
+        if not stills or name not in stills:
+            return
+        save_frame(self, stills.pop(name))
+        if not stills:
+            raise EndSceneEarlyException()
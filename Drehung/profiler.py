@@ -0,0 +1,163 @@
+"""
+Laufzeit-Profil je self.play / self.wait einer Szene.
+
+Einschalten mit der Umgebungsvariable LEKTION_PROFILE (Ausgabeordner oder "1" für media/profile):
+    LEKTION_PROFILE=1 manim -ql drehungen.py DrehungenV5
+
+Pro Aufruf wird festgehalten: Wandzeit (inkl. des construct-Codes seit dem letzten Aufruf),
+davon TeX, Pango-Text, Updater, Rasterung und Kodierung, Anzahl Mobjects/Punkte,
+Spitzen-RSS und der aktuelle ProgressBar-Abschnitt. Ausgabe:
+    <Szene>.json    - alle Einträge
+    <Szene>.folded  - gefaltete Stacks für Flamegraphs (flamegraph.pl, speedscope, inferno)
+"""
+import functools
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from manim import *
+from manim.mobject.text.tex_mobject import SingleStringMathTex
+from manim.utils.family import extract_mobject_family_members
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILE_ENV = "LEKTION_PROFILE"
+CATEGORIES = ["tex", "text", "updaters", "raster", "encode"]
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 ** 2 if sys.platform == "darwin" else rss / 1024
+
+
+class Timers:
+    """Summiert Zeiten je Kategorie; verschachtelte Aufrufe derselben Kategorie zählen einmal."""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self.depth = defaultdict(int)
+        self.patches = []
+
+    def wrap(self, category, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            if self.depth[category]:
+                return fn(*args, **kwargs)
+            self.depth[category] += 1
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.totals[category] += time.perf_counter() - t0
+                self.depth[category] -= 1
+
+        return timed
+
+    def patch(self, owner, name, category):
+        original = getattr(owner, name)
+        self.patches.append((owner, name, vars(owner).get(name)))
+        setattr(owner, name, self.wrap(category, original))
+
+    def unpatch(self):
+        for owner, name, original in reversed(self.patches):
+            if original is None:
+                delattr(owner, name)  # Instanz-Attribut -> wieder die Methode der Klasse
+            else:
+                setattr(owner, name, original)
+        self.patches = []
+
+    def take(self):
+        totals, self.totals = dict(self.totals), defaultdict(float)
+        return totals
+
+
+class ProfilingMixin:
+    """
+    Vor Scene in die Basisklassen setzen (LessonScene tut das bereits), z.B.
+        class Intro(ProfilingMixin, Scene)
+    Ohne LEKTION_PROFILE verhält sich die Szene unverändert.
+    """
+
+    def render(self, *args, **kwargs):
+        target = os.environ.get(PROFILE_ENV)
+        if not target:
+            return super().render(*args, **kwargs)
+
+        self.timers = Timers()
+        self.profile = []
+        self.timers.patch(SingleStringMathTex, "__init__", "tex")
+        self.timers.patch(Text, "__init__", "text")
+        self.timers.patch(MarkupText, "__init__", "text")
+        self.timers.patch(self.renderer.camera, "capture_mobjects", "raster")
+        self.timers.patch(self.renderer.file_writer, "write_frame", "encode")
+        self.profile_mark = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            self.timers.unpatch()
+            out_dir = Path(config.media_dir) / "profile" if target == "1" else Path(target)
+            self.write_profile(out_dir)
+
+    def update_mobjects(self, dt):
+        if not hasattr(self, "timers"):
+            return super().update_mobjects(dt)
+        with_timer = self.timers.wrap("updaters", super().update_mobjects)
+        return with_timer(dt)
+
+    def play(self, *args, **kwargs):
+        if not hasattr(self, "timers"):
+            return super().play(*args, **kwargs)
+        t0 = time.perf_counter()
+        result = super().play(*args, **kwargs)
+        t1 = time.perf_counter()
+        self.record_play(args, t1 - t0, t1 - self.profile_mark)
+        self.profile_mark = t1
+        return result
+
+    def record_play(self, args, play_wall, wall):
+        animations = [type(a).__name__ for a in args]
+        family = extract_mobject_family_members(self.mobjects)
+        section_idx = getattr(self, "section_idx", None)
+        sections = getattr(self, "sections", [])
+        self.profile.append({
+            "index": len(self.profile),
+            "kind": "wait" if animations == ["Wait"] else "play",
+            "animations": animations,
+            "section": section_idx,
+            "section_name": sections[section_idx] if section_idx is not None and sections else None,
+            "wall": wall,
+            "play_wall": play_wall,
+            "times": self.timers.take(),
+            "mobjects": len(family),
+            "points": int(sum(len(m.points) for m in family)),
+            "peak_rss_mb": peak_rss_mb(),
+        })
+
+    def write_profile(self, out_dir):
+        out_dir.mkdir(parents=True, exist_ok=True)
+        name = type(self).__name__
+        (out_dir / f"{name}.json").write_text(json.dumps(self.profile, indent=1))
+
+        # gefaltete Stacks: Szene;Abschnitt;Aufruf;Kategorie Mikrosekunden
+        lines = []
+        for entry in self.profile:
+            section = entry["section_name"] or "-"
+            call = f"{entry['index']:03d} {entry['kind']} {'+'.join(entry['animations'])}".replace(";", ",")
+            stack = f"{name};{section};{call}"
+            rest = entry["wall"]
+            for category in CATEGORIES:
+                t = entry["times"].get(category, 0.0)
+                if t > 0:
+                    lines.append(f"{stack};{category} {int(t * 1e6)}")
+                    rest -= t
+            if rest > 0:
+                lines.append(f"{stack};other {int(rest * 1e6)}")
+        (out_dir / f"{name}.folded").write_text("\n".join(lines) + "\n")
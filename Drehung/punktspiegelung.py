@@ -1,15 +1,10 @@
 from manim import *
-import numpy as np
-
-config.background_color = "#0e0e0e"
 
+from bausteine import MarkerCloud, cached_plane, cached_text
+from beschriftung import place_labels
+from lektion import LessonScene
 
-def rotate_point(pt, angle, about=np.array([0, 0, 0])):
-    v = np.array(pt) - np.array(about)
-    c, s = np.cos(angle), np.sin(angle)
-    R = np.array([[c, -s], [s, c]])
-    v2 = R @ v[:2]
-    return np.array([v2[0], v2[1], 0]) + np.array(about)
+config.background_color = "#0e0e0e"
 
 
 class ProgressBar(VGroup):
@@ -25,8 +20,8 @@ class ProgressBar(VGroup):
         for i in range(n):
             x = -total_w / 2 + i * spacing
             circ = Circle(radius=0.22, stroke_width=2, color=GRAY).move_to([x, y, 0])
-            num = Text(str(i + 1), font_size=16).move_to(circ.get_center())
-            lbl = Text(sections[i], font_size=14, color=GRAY).next_to(circ, UP, buff=0.08)
+            num = cached_text(str(i + 1), font_size=16).move_to(circ.get_center())
+            lbl = cached_text(sections[i], font_size=14, color=GRAY).next_to(circ, UP, buff=0.08)
             self.add(circ, num, lbl)
             self.circles.add(circ)
             self.labels.add(lbl)
@@ -48,17 +43,20 @@ class ProgressBar(VGroup):
             line.set_color(GREEN if i < idx - 0 else GRAY)
 
 
-class PunktspiegelungV4(Scene):
+class PunktspiegelungV4(LessonScene):
+    sections = ["Definition", "Eigenschaften", "Drehung", "Bestimmung von Z"]
+    keyframes = ["punktspiegelung", "fixgerade", "strecke", "mittelpunkt"]
+
     def construct(self):
         config.tex_template.add_to_preamble(r"\usepackage{mathtools}")
-        sections = ["Definition", "Eigenschaften", "Drehung", "Bestimmung von Z"]
-        prog = ProgressBar(sections)
+        prog = ProgressBar(self.sections)
         self.play(FadeIn(prog))
-        prog.set_progress(0)
+        self.begin_section(prog, 0)
         self.add(prog)
+        self.set_static_layer(prog)
 
         # ---------- 1) Definition ----------
-        prog.set_progress(0)
+        self.begin_section(prog, 0)
 
         # Place Z at origin (outside triangle)
         Z = Dot(ORIGIN, color=YELLOW)
@@ -72,14 +70,14 @@ class PunktspiegelungV4(Scene):
         # vertices and dots + labels (labels BEFORE rotation)
         verts_ur = tri_ur.get_vertices()
         verts_img = tri_img.get_vertices()
-        dots_ur = [Cross(Dot(v), stroke_width=3, stroke_color=BLUE) for v in verts_ur]
+        dots_ur = MarkerCloud(verts_ur, color=BLUE, stroke_width=3)
         labels_ur = [MathTex("P"), MathTex("Q"), MathTex("R")]
-        for lab, d in zip(labels_ur, dots_ur):
-            lab.next_to(d, UR, buff=0.05)
+        for i, lab in enumerate(labels_ur):
+            lab.next_to(dots_ur.marker(i), UR, buff=0.05)
 
         # show original triangle and labels and Z
         self.play(Create(tri_ur), FadeIn(Z), Write(Z_label))
-        self.play(*[FadeIn(d) for d in dots_ur], *[Write(l) for l in labels_ur])
+        self.play(FadeIn(dots_ur), *[Write(l) for l in labels_ur])
         self.wait(0.5)
         tri_move = tri_ur.copy()
 
@@ -91,11 +89,11 @@ class PunktspiegelungV4(Scene):
         self.play(Rotate(tri_move, PI, about_point=Z.get_center()))
         self.wait(0.5)
         # but actually display tri_img (rotated copy) and its dots/labels
-        dots_img = [Cross(Dot(v), stroke_width=3, stroke_color=GREEN) for v in verts_img]
+        dots_img = MarkerCloud(verts_img, color=GREEN, stroke_width=3)
         labels_img = [MathTex("P'"), MathTex("Q'"), MathTex("R'")]
-        for lab, d in zip(labels_img, dots_img):
-            lab.next_to(d, UR, buff=0.05)
-        self.play(FadeIn(tri_img), *[FadeIn(d) for d in dots_img], *[Write(l) for l in labels_img])
+        for i, lab in enumerate(labels_img):
+            lab.next_to(dots_img.marker(i), UR, buff=0.05)
+        self.play(FadeIn(tri_img), FadeIn(dots_img), *[Write(l) for l in labels_img])
         self.wait(0.5)
         self.play(FadeOut(notation))
 
@@ -108,16 +106,17 @@ class PunktspiegelungV4(Scene):
 
         # keep tri_ur and tri_img visible for a moment
         self.wait(0.4)
-        final_text = Text("Punktspiegelung = Drehung um 180°", color=ORANGE, font_size=28).move_to(DOWN * 3)
+        final_text = cached_text("Punktspiegelung = Drehung um 180°", color=ORANGE, font_size=28).move_to(DOWN * 3)
         self.play(Write(final_text))
+        self.checkpoint("punktspiegelung")
         self.wait(0.5)
 
-        self.play(FadeOut(tri_ur, tri_img, *dots_ur, *dots_img, *labels_ur, *labels_img, Z, Z_label, tri_move,
+        self.play(FadeOut(tri_ur, tri_img, dots_ur, dots_img, *labels_ur, *labels_img, Z, Z_label, tri_move,
                           final_text), run_time=0.5)
         self.wait(0.5)
 
         # ---------- 2) Eigenschaften ----------
-        prog.set_progress(1)
+        self.begin_section(prog, 1)
         Z2 = Dot(ORIGIN, color=YELLOW)
         Z2_label = MathTex("Z").next_to(Z2, DOWN, buff=0.08)
 
@@ -138,8 +137,9 @@ class PunktspiegelungV4(Scene):
         self.wait(0.5)
         self.play(FadeToColor(Line_rot, GREEN), FadeIn(linep_label), FadeOut(notation))
         self.wait(0.5)
-        final_text = Text("Jede Gerade durch Z ist Fixgerade", color=ORANGE, font_size=28).move_to(DOWN * 3)
+        final_text = cached_text("Jede Gerade durch Z ist Fixgerade", color=ORANGE, font_size=28).move_to(DOWN * 3)
         self.play(Write(final_text))
+        self.checkpoint("fixgerade")
         self.wait(0.5)
         self.play(
             FadeOut(full_line, Line_rot, Z2, Z2_label, final_text, linep_label, line_label),
@@ -147,14 +147,10 @@ class PunktspiegelungV4(Scene):
         self.wait(0.5)
 
         # ---------- 3) Konstruktion ----------
-        prog.set_progress(2)
-        plane = NumberPlane(
-            x_range=[-6, 6, 1],
-            y_range=[-3, 4, 1],
-            background_line_style={"stroke_color": GREY, "stroke_width": 1, "stroke_opacity": 0.35},
-            axis_config={"stroke_color": GREY_B, "stroke_width": 2, "stroke_opacity": 0.8, "include_tip": True},
-        ).add_coordinates(font_size=20, stroke_width=1, num_decimal_places=0).scale(0.95)
+        self.begin_section(prog, 2)
+        plane = cached_plane()
         self.play(Create(plane))
+        self.set_static_layer(prog, plane)
 
         Z4 = Cross(Dot(plane.coords_to_point(0, 0)), stroke_width=2, stroke_color=YELLOW)
         Z4_label = MathTex("Z").next_to(Z4, DOWN, buff=0.08)
@@ -199,6 +195,7 @@ class PunktspiegelungV4(Scene):
         # Now rotate original PQ_seg and points by 180° to show they match P'Q'
         self.play(Rotate(rot, PI, about_point=Z4.get_center()))
         self.play(FadeToColor(rot, (GREEN + BLUE)))
+        self.checkpoint("strecke")
         self.wait(0.5)
         # leave P', Q' visible, fade rotated originals (they coincide)
         self.play(
@@ -207,7 +204,7 @@ class PunktspiegelungV4(Scene):
         self.wait(0.5)
 
         # ---------- 4) Bestimmung ----------
-        prog.set_progress(3)
+        self.begin_section(prog, 3)
         # create triangle and derive image by 180° rotation (Punktspiegelung)
         tri_ur = Polygon(plane.coords_to_point(-2.5, -1), plane.coords_to_point(-1, -2),
                          plane.coords_to_point(-2, 1), color=BLUE, fill_opacity=0.8, stroke_width=3)
@@ -218,15 +215,16 @@ class PunktspiegelungV4(Scene):
 
         verts_ur = tri_ur.get_vertices()
         verts_img = tri_img.get_vertices()
-        dots_ur = [Cross(Dot(v), stroke_width=2, stroke_color=BLUE) for v in verts_ur]
-        dots_img = [Cross(Dot(v), stroke_width=2, stroke_color=GREEN) for v in verts_img]
+        dots_ur = MarkerCloud(verts_ur, color=BLUE, stroke_width=2)
+        dots_img = MarkerCloud(verts_img, color=GREEN, stroke_width=2)
         labels_ur = [MathTex("P"), MathTex("Q"), MathTex("R")]
         labels_img = [MathTex("P'"), MathTex("Q'"), MathTex("R'")]
-        for lab, v in zip(labels_ur, verts_ur): lab.next_to(v, UR, buff=0.05)
-        for lab, v in zip(labels_img, verts_img): lab.next_to(v, UR, buff=0.05)
+        # Beschriftungen ohne Überlappung (bevorzugt UR wie bisher)
+        place_labels(labels_ur + labels_img, [dots.marker(i) for dots in (dots_ur, dots_img) for i in range(3)],
+                     obstacles=[tri_ur, tri_img, dots_ur, dots_img, *map(Line, verts_ur, verts_img)])
 
-        self.play(Create(tri_ur), *[FadeIn(d) for d in dots_ur], *[Write(l) for l in labels_ur])
-        self.play(Create(tri_img), *[FadeIn(d) for d in dots_img], *[Write(l) for l in labels_img])
+        self.play(Create(tri_ur), FadeIn(dots_ur), *[Write(l) for l in labels_ur])
+        self.play(Create(tri_img), FadeIn(dots_img), *[Write(l) for l in labels_img])
         self.wait(0.5)
 
         # Draw PP' for first vertex and compute midpoint -> Z
@@ -248,6 +246,7 @@ class PunktspiegelungV4(Scene):
         R_img = verts_img[2]
         seq_RRp = Line(R_ur, R_img, color=ORANGE)
         self.play(Create(seq_QQp), Create(seq_RRp))
+        self.checkpoint("mittelpunkt")
         self.wait(0.5)
         self.play(FadeOut(seq_QQp, seq_RRp), run_time=0.5)
         self.wait(0.5)
@@ -0,0 +1,124 @@
+"""
+Regressionstest mit Referenzbildern.
+
+Je Szene werden nur ihre Schlüsselbilder gerastert: die Checkpoints aus LessonScene.keyframes, an
+inhaltsreichen Stellen vor dem Aufräumen eines Abschnitts (Szenen ohne keyframes wie Intro: das
+letzte Bild) - als Trockenlauf wie in stills.py, ohne Video, alle Szenen parallel. Die Bilder
+werden mit den Referenz-PNGs in referenz/<Qualität>/<Szene>/ verglichen: Farbabstand im YIQ-Raum nach
+leichter Glättung (Kantenglättung und Subpixel-Verschiebungen zählen nicht); ein Bild gilt als
+gleich, solange höchstens AREA_TOL der Pixel um mehr als PIXEL_TOL abweichen. Für Abweichungen
+liegt ein Differenzbild in media/referenz/<Szene>/.
+
+    python referenz.py                      # alle Kurs-Szenen prüfen (Exit-Code 1 bei Abweichung)
+    python referenz.py --update             # Referenzbilder nach gewollten Änderungen neu schreiben
+    python referenz.py drehungen.py:DrehungenV5
+"""
+import argparse
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from entwurf import DRAFT_ENV
+from lektion import HERE, load_scene_class
+from render_kurs import discover_scenes
+from stills import FINAL, export_stills
+
+GOLDEN_DIR = HERE / "referenz"
+OUT_DIR = HERE / "media" / "referenz"
+QUALITY = "l"
+PIXEL_TOL = 0.1    # normierter YIQ-Abstand (0..1), ab dem ein Pixel als verschieden gilt
+AREA_TOL = 0.005   # Anteil verschiedener Pixel, der noch als gleich gilt
+
+# YIQ-Gewichte wie in pixelmatch; größter möglicher Abstand für Farben in [0, 1]
+YIQ = np.array([[0.29889531, 0.58662247, 0.11448223],
+                [0.59597799, -0.27417610, -0.32180189],
+                [0.21147017, -0.52261711, 0.31114694]])
+YIQ_WEIGHTS = np.array([0.5053, 0.299, 0.1957])
+YIQ_MAX = 35215 / 255 ** 2
+
+
+def keyframes(scene_class):
+    return list(getattr(scene_class, "keyframes", None) or [FINAL])
+
+
+def _smooth(rgb):
+    # 3x3-Mittelwert, Rand wiederholt
+    padded = np.pad(rgb, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    h, w = rgb.shape[:2]
+    return sum(padded[i:i + h, j:j + w] for i in range(3) for j in range(3)) / 9
+
+
+def perceptual_diff(a, b):
+    """Normierter Farbabstand je Pixel (0..1) zweier RGB(A)-Bilder gleicher Größe."""
+    a, b = (_smooth(np.asarray(img.convert("RGB"), dtype=float) / 255) for img in (a, b))
+    d = (a - b) @ YIQ.T
+    return np.sqrt((d ** 2 @ YIQ_WEIGHTS) / YIQ_MAX)
+
+
+def compare(image, golden, diff_path):
+    """Gibt (gleich?, Anteil verschiedener Pixel) zurück; schreibt bei Abweichung ein Differenzbild."""
+    if image.size != golden.size:
+        return False, 1.0
+    differs = perceptual_diff(image, golden) > PIXEL_TOL
+    fraction = float(differs.mean())
+    if fraction > AREA_TOL:
+        # Referenz abgedunkelt, Abweichungen rot
+        out = (np.asarray(golden.convert("RGB"), dtype=float) * 0.3).astype(np.uint8)
+        out[differs] = (255, 0, 0)
+        diff_path.parent.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(out).save(diff_path)
+        return False, fraction
+    return True, fraction
+
+
+def run(specs, quality=QUALITY, update=False, workers=None):
+    """Rastert alle Schlüsselbilder und vergleicht sie; gibt die Liste der Abweichungen zurück."""
+    os.environ.pop(DRAFT_ENV, None)  # Referenzbilder nie im Entwurfsmodus
+    jobs = []
+    for spec in specs:
+        file, scene = spec.split(":")
+        frames = {name: [OUT_DIR / scene / f"{name}.png"] for name in keyframes(load_scene_class(file, scene))}
+        jobs.append((file, scene, frames))
+
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(export_stills, file, scene, frames, quality) for file, scene, frames in jobs]
+        for (file, scene, frames), future in zip(jobs, futures):
+            missing = set(future.result())
+            for name, (path,) in frames.items():
+                golden = GOLDEN_DIR / quality / scene / path.name
+                if name in missing:
+                    failures.append(f"{scene}/{name}: Schlüsselbild nicht erreicht")
+                elif update:
+                    golden.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(path, golden)
+                elif not golden.exists():
+                    failures.append(f"{scene}/{name}: keine Referenz (mit --update anlegen)")
+                else:
+                    same, fraction = compare(Image.open(path), Image.open(golden),
+                                             OUT_DIR / scene / f"{name}_diff.png")
+                    if not same:
+                        failures.append(f"{scene}/{name}: {fraction:.2%} der Pixel weichen ab")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", help="datei.py:Szene (Standard: alle Kurs-Szenen)")
+    parser.add_argument("--update", action="store_true", help="Referenzbilder neu schreiben")
+    parser.add_argument("-q", "--quality", default=QUALITY, choices="lmhpk")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    failures = run(args.scenes or discover_scenes(), args.quality, args.update, args.workers)
+    for line in failures:
+        print(line)
+    if args.update:
+        print(f"Referenzbilder -> {GOLDEN_DIR / args.quality}")
+    elif not failures:
+        print("alle Schlüsselbilder stimmen mit den Referenzen überein")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,138 @@
+"""
+Rendert den ganzen Kurs: alle Scene-Unterklassen in Drehung/ in allen gewünschten Qualitäten.
+
+- Lektionsszenen werden abschnittsweise gerendert, andere Szenen am Stück.
+- Aktuelle Teile (gleicher Inhalts-Hash, siehe section_cache.py) werden übersprungen.
+- Die übrigen Jobs laufen in einem Pool mit einem Manim-Prozess je Kern,
+  die längsten zuerst (Dauer aus dem letzten Lauf, siehe media/manifest.json).
+- Danach werden die Videos zusammengesetzt und das Manifest mit Ausgaben und Zeiten geschrieben.
+
+    python render_kurs.py -q l h
+"""
+import argparse
+import ast
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lektion import HERE, LessonScene, load_scene_class
+from render_parallel import MEDIA, concat_movies, render_section
+from section_cache import (cached_section, collect_section_hashes, quality_config, scene_hash,
+                           store_section)
+from tex_prepass import prepass
+
+MANIFEST = MEDIA / "manifest.json"
+
+
+def _base_name(node):
+    return node.id if isinstance(node, ast.Name) else getattr(node, "attr", "")
+
+
+def _in_kurs(node):
+    """False für Klassen mit `in_kurs = False` (z.B. parametrisierte Aufgabenszenen)."""
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign) and any(getattr(t, "id", None) == "in_kurs" for t in stmt.targets):
+            return not (isinstance(stmt.value, ast.Constant) and stmt.value.value is False)
+    return True
+
+
+def discover_scenes(directory=HERE):
+    """Alle konkreten Scene-Unterklassen in directory/*.py als "datei.py:Szene" (statisch, ohne Import)."""
+    classes = []
+    for path in sorted(directory.glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                bases = [_base_name(b) for b in node.bases]
+                if any(b.endswith("Scene") for b in bases):
+                    classes.append((path.name, node.name, bases, _in_kurs(node)))
+    # Basisklassen wie LessonScene selbst sind keine Szenen
+    used_as_base = {b for _, _, bases, _ in classes for b in bases}
+    return [f"{file}:{name}" for file, name, _, in_kurs in classes if in_kurs and name not in used_as_base]
+
+
+def load_manifest():
+    try:
+        return json.loads(MANIFEST.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def estimate(manifest, scene, part, quality):
+    """Dauer eines Jobs aus dem letzten Lauf; sonst aus einer anderen Qualität hochgerechnet."""
+    def pixels_per_second(q):
+        c = quality_config(q)
+        return c["pixel_width"] * c["pixel_height"] * c["frame_rate"]
+
+    for q, entry in ((q, manifest.get(f"{scene}@{q}")) for q in [quality, "h", "m", "l", "p", "k"]):
+        if entry and entry.get("seconds", {}).get(part) is not None:
+            return entry["seconds"][part] * pixels_per_second(quality) / pixels_per_second(q)
+    return float("inf")  # unbekannt: zuerst starten
+
+
+def plan(scenes, qualities):
+    """Alle Teile als (datei, szene, qualität, abschnitt, hash); abschnitt None = ganze Szene."""
+    parts = []
+    for quality in qualities:
+        for spec in scenes:
+            file, scene = spec.split(":")
+            scene_class = load_scene_class(file, scene)
+            if issubclass(scene_class, LessonScene):
+                for idx, section_hash in enumerate(collect_section_hashes(scene_class, quality)):
+                    parts.append((file, scene, quality, idx, section_hash))
+            else:
+                parts.append((file, scene, quality, None, scene_hash(scene_class, quality)))
+    return parts
+
+
+def render_kurs(qualities, scenes=None, workers=None):
+    scenes = scenes or discover_scenes()
+    manifest = load_manifest()
+    prepass(scenes, workers)
+
+    parts = plan(scenes, qualities)
+    jobs = [p for p in parts if not cached_section(p[1], p[4])]
+    jobs.sort(key=lambda p: estimate(manifest, p[1], str(p[3]), p[2]), reverse=True)
+    print(f"{len(parts) - len(jobs)} Teile aktuell, {len(jobs)} zu rendern")
+
+    seconds = {}
+
+    def run(job):
+        file, scene, quality, idx, part_hash = job
+        t0 = time.perf_counter()
+        store_section(scene, part_hash, render_section(file, scene, idx, quality))
+        seconds[job] = time.perf_counter() - t0
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        list(pool.map(run, jobs))
+
+    for quality in qualities:
+        for spec in scenes:
+            scene = spec.split(":")[1]
+            key = f"{scene}@{quality}"
+            own = [p for p in parts if p[1] == scene and p[2] == quality]
+            out = concat_movies([cached_section(scene, p[4]) for p in own],
+                                MEDIA / "kurs" / quality / f"{scene}.mp4")
+            previous = manifest.get(key, {}).get("seconds", {})
+            manifest[key] = {
+                "scene": spec,
+                "quality": quality,
+                "output": str(out.relative_to(HERE)),
+                "hashes": [p[4] for p in own],
+                "rendered": [str(p[3]) for p in own if p in seconds],
+                # Renderzeit je Teil; für übernommene Teile die Zeit aus dem letzten Lauf
+                "seconds": {str(p[3]): seconds.get(p, previous.get(str(p[3]))) for p in own},
+            }
+    MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST.write_text(json.dumps(manifest, indent=1))
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-q", "--quality", nargs="+", default=["h"], choices=list("lmhpk"))
+    parser.add_argument("-s", "--scenes", nargs="*", default=None, help="datei.py:Szene (Standard: alle)")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    args = parser.parse_args()
+    render_kurs(args.quality, args.scenes, args.workers)
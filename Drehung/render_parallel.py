@@ -0,0 +1,89 @@
+"""
+Rendert die Lektionsszenen abschnittsweise (ProgressBar-Abschnitte) in parallelen
+Manim-Prozessen und setzt die Teilvideos danach in der richtigen Reihenfolge zusammen.
+Unveränderte Abschnitte (gleicher Inhalts-Hash, siehe section_cache.py) werden unverändert
+aus media/section_cache übernommen.
+
+    python render_parallel.py                         # DrehungenV5, PunktspiegelungV4, VektorenV6 in 1080p
+    python render_parallel.py -q l vektoren.py:VektorenV6
+"""
+import argparse
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ausgabe import STREAM_ENV
+from lektion import HERE, SECTIONS_ENV, load_scene_class
+from section_cache import cached_section, collect_section_hashes, store_section
+from tex_prepass import prepass
+
+MEDIA = HERE / "media"
+DEFAULT_SCENES = ["drehungen.py:DrehungenV5", "punktspiegelung.py:PunktspiegelungV4", "vektoren.py:VektorenV6"]
+
+
+def render_section(file, scene, idx, quality):
+    """Rendert Abschnitt idx in einem eigenen Manim-Prozess (idx=None: ganze Szene)."""
+    # feste Verzeichnisse je Abschnitt, damit Manims Teilvideo-Cache beim nächsten Lauf greift
+    part = "all" if idx is None else str(idx)
+    media_dir = MEDIA / "sections" / scene / quality / part
+    name = scene if idx is None else f"{scene}_{idx:02d}"
+    env = dict(os.environ, **{STREAM_ENV: "1"})
+    if idx is not None:
+        env[SECTIONS_ENV] = str(idx)
+    cmd = ["manim", "render", f"-q{quality}", "--media_dir", str(media_dir), "-o", name, str(HERE / file), scene]
+    subprocess.run(cmd, cwd=HERE, env=env, check=True, stdout=subprocess.DEVNULL)
+    return next(media_dir.glob(f"videos/**/{name}.mp4"))
+
+
+def concat_movies(parts, out):
+    """Hängt fertige Videos ohne Neukodierung aneinander (ffmpeg concat)."""
+    out.parent.mkdir(parents=True, exist_ok=True)
+    listing = out.with_suffix(".txt")
+    listing.write_text("".join(f"file '{Path(p).as_posix()}'\n" for p in parts))
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                    "-i", str(listing), "-c", "copy", str(out)], check=True)
+    listing.unlink()
+    return out
+
+
+def render_parallel(scenes, quality="h", workers=None):
+    # alle Formeln vorab in den gemeinsamen Cache, sonst übersetzen die Worker dieselben Formeln gleichzeitig
+    prepass(scenes, workers)
+
+    # nur Abschnitte rendern, deren Inhalts-Hash noch nicht im Abschnitts-Cache liegt
+    parts, jobs = {}, []
+    for spec in scenes:
+        file, scene = spec.split(":")
+        for idx, section_hash in enumerate(collect_section_hashes(load_scene_class(file, scene), quality)):
+            cached = cached_section(scene, section_hash)
+            if cached:
+                parts[scene, idx] = cached
+            else:
+                jobs.append((file, scene, idx, section_hash))
+    print(f"{len(parts)} Abschnitte aus dem Cache, {len(jobs)} neu zu rendern")
+
+    def run(job):
+        file, scene, idx, section_hash = job
+        return store_section(scene, section_hash, render_section(file, scene, idx, quality))
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for (_, scene, idx, _), movie in zip(jobs, pool.map(run, jobs)):
+            parts[scene, idx] = movie
+
+    outputs = []
+    for spec in scenes:
+        scene = spec.split(":")[1]
+        scene_parts = [parts[key] for key in sorted(k for k in parts if k[0] == scene)]
+        outputs.append(concat_movies(scene_parts, MEDIA / "lektionen" / quality / f"{scene}.mp4"))
+    return outputs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="*", default=DEFAULT_SCENES, help="datei.py:Szene")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    args = parser.parse_args()
+    for out in render_parallel(args.scenes, args.quality, args.workers):
+        print(out)
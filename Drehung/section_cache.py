@@ -0,0 +1,144 @@
+"""
+Inhalts-Hash je ProgressBar-Abschnitt für inkrementelles Rendern.
+
+Der Hash eines Abschnitts umfasst
+  - den Code des Abschnitts in construct() (von begin_section(prog, k) bis zum nächsten Abschnitt)
+    samt dem Vorspann von construct() vor dem ersten begin_section,
+  - den übrigen Code der Szenendatei und aller lokal importierten Hilfsmodule,
+  - die Render-Konfiguration (Auflösung, fps, Hintergrund, Manim-Version),
+  - einen Schnappschuss des Zustands beim Eintritt: alle Mobjects (und einfachen Werte)
+    in den lokalen Variablen von construct() sowie die Mobjects der Szene.
+Ändert sich ein Abschnitt, ändert sich sein Hash; spätere Abschnitte behalten ihren Hash,
+solange ihr Eintrittszustand gleich bleibt. render_parallel.py rendert nur Abschnitte,
+deren Hash noch nicht in media/section_cache liegt.
+"""
+import hashlib
+import inspect
+import re
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+
+import manim
+from manim import Mobject, config, tempconfig
+from manim.constants import QUALITIES
+
+from kamera import mobject_fingerprint
+
+HERE = Path(__file__).resolve().parent
+CACHE_DIR = HERE / "media" / "section_cache"
+SECTION_CALL = re.compile(r"self\.begin_section\(\s*\w+\s*,\s*(\d+)\s*\)")
+
+
+def code_regions(scene_class):
+    """
+    Quelltext von construct() je Abschnitt. Der Vorspann vor dem ersten begin_section
+    (z.B. config.background_color, tex_template.add_to_preamble) wirkt auf alle Abschnitte
+    und gehört daher zu jedem.
+    """
+    lines = inspect.getsource(scene_class.construct).splitlines()
+    starts = {}
+    for i, line in enumerate(lines):
+        m = SECTION_CALL.search(line)
+        if m:
+            starts.setdefault(int(m.group(1)), i)
+    bounds = sorted(starts.items(), key=lambda item: item[1])
+    prologue = lines[:bounds[0][1]] if bounds else lines
+    regions = {idx: [] for idx in range(len(scene_class.sections))}
+    for j, (idx, start) in enumerate(bounds):
+        regions[idx] = lines[start:(bounds[j + 1][1] if j + 1 < len(bounds) else len(lines))]
+    return {idx: "\n".join(prologue + body) for idx, body in regions.items()}
+
+
+def local_sources(module, seen=None):
+    """Quelltexte des Moduls und aller (transitiv) importierten Module aus Drehung/."""
+    seen = {} if seen is None else seen
+    name = getattr(module, "__file__", None)
+    if name is None or Path(name).resolve().parent != HERE or name in seen:
+        return seen
+    seen[name] = Path(name).read_text(encoding="utf-8")
+    for value in vars(module).values():
+        dep = value if inspect.ismodule(value) else inspect.getmodule(value)
+        if dep is not None:
+            local_sources(dep, seen)
+    return seen
+
+
+def value_fingerprint(value):
+    if isinstance(value, Mobject):
+        return ("mob", type(value).__name__, mobject_fingerprint([value]))
+    if isinstance(value, (list, tuple)) and any(isinstance(v, Mobject) for v in value):
+        return tuple(value_fingerprint(v) for v in value)
+    if isinstance(value, (int, float, str, bool, type(None))):
+        return value
+    if isinstance(value, np.ndarray):
+        return value.tobytes()
+    if isinstance(value, (list, tuple)):
+        return repr(value)
+    return None  # Funktionen usw.: durch den Code-Hash abgedeckt
+
+
+def construct_frame(scene):
+    frame = sys._getframe()
+    code = type(scene).construct.__code__
+    while frame is not None and frame.f_code is not code:
+        frame = frame.f_back
+    return frame
+
+
+def section_hash(scene, idx):
+    scene_class = type(scene)
+    h = hashlib.sha256()
+    sources = local_sources(inspect.getmodule(scene_class))
+    construct_src = inspect.getsource(scene_class.construct)
+    for name in sorted(sources):
+        h.update(sources[name].replace(construct_src, "").encode())
+    h.update(code_regions(scene_class).get(idx, "").encode())
+    h.update(repr((scene_class.__name__, idx, scene_class.sections[idx], manim.__version__,
+                   config.pixel_width, config.pixel_height, config.frame_rate,
+                   str(config.background_color), config.movie_file_extension)).encode())
+
+    frame = construct_frame(scene)
+    local_vars = {} if frame is None else frame.f_locals
+    state = [(name, value_fingerprint(value)) for name, value in sorted(local_vars.items()) if name != "self"]
+    h.update(repr(state).encode())
+    h.update(repr(mobject_fingerprint(scene.mobjects)).encode())
+    return h.hexdigest()[:20]
+
+
+def quality_config(quality):
+    q = next(v for v in QUALITIES.values() if v["flag"] == quality)
+    return {"pixel_width": q["pixel_width"], "pixel_height": q["pixel_height"], "frame_rate": q["frame_rate"]}
+
+
+def collect_section_hashes(scene_class, quality):
+    """Trockenlauf ohne Rendern; liefert die Hashes aller Abschnitte."""
+    with tempconfig({**quality_config(quality), "dry_run": True, "disable_caching": True}):
+        scene = scene_class(skip_animations=True)
+        scene.render()
+    return scene.section_hashes
+
+
+def scene_hash(scene_class, quality):
+    """Hash einer ganzen Szene ohne Abschnitte (z.B. Intro): Code und Render-Konfiguration."""
+    h = hashlib.sha256()
+    sources = local_sources(inspect.getmodule(scene_class))
+    for name in sorted(sources):
+        h.update(sources[name].encode())
+    h.update(repr((scene_class.__name__, manim.__version__, sorted(quality_config(quality).items()),
+                   str(config.background_color), config.movie_file_extension)).encode())
+    return h.hexdigest()[:20]
+
+
+def cached_section(scene_name, section_hash):
+    path = CACHE_DIR / scene_name / f"{section_hash}.mp4"
+    return path if path.exists() else None
+
+
+def store_section(scene_name, section_hash, movie):
+    path = CACHE_DIR / scene_name / f"{section_hash}.mp4"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(movie, path)
+    return path
@@ -0,0 +1,92 @@
+"""
+Standbilder (PNG/PDF) benannter Zwischenstände für Arbeitsblätter, ohne das Video zu rendern.
+
+Die Szene läuft als Trockenlauf (alle Animationen übersprungen, kein Video); an jedem
+angeforderten self.checkpoint(name) wird genau ein Bild gerastert. Nach dem letzten
+Checkpoint bricht construct() ab. Zusätzlich gibt es in jeder Szene "ende" (letztes Bild).
+Mehrere Szenen bzw. Aufgabenvarianten laufen gleichzeitig in einem Prozess-Pool.
+
+    python stills.py drehungen.py:DrehungenV5:mittelsenkrechten punktspiegelung.py:PunktspiegelungV4:mittelpunkt
+    python stills.py --aufgaben 30 --seed 7 --stufe mittel --pdf    # VektorenAufgabe: aufgabe + loesung je Variante
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import tempconfig
+
+from aufgaben import STUFEN, TASK_ENV, generate_tasks, task_env
+from lektion import HERE, load_scene_class, save_frame
+from section_cache import quality_config
+
+STILLS_DIR = HERE / "media" / "stills"
+# letztes Bild einer Szene, auch für Szenen ohne checkpoint() (z.B. Intro)
+FINAL = "ende"
+
+
+def export_stills(file, scene, stills, quality="h", env=None):
+    """
+    Rastert die Checkpoints einer Szene; stills: {checkpoint: [Ausgabepfade]}.
+    env: zusätzliche Umgebungsvariablen (z.B. die Aufgabe für VektorenAufgabe).
+    Gibt die Checkpoints zurück, die in construct() nicht vorkamen.
+    """
+    os.environ.update(env or {})
+    scene_class = load_scene_class(file, scene)
+    with tempconfig({**quality_config(quality), "dry_run": True, "disable_caching": True}):
+        instance = scene_class(skip_animations=True)
+        instance.stills = {name: [Path(p) for p in paths] for name, paths in stills.items()}
+        instance.render()
+        if FINAL in instance.stills:
+            save_frame(instance, instance.stills.pop(FINAL))
+    return sorted(instance.stills)
+
+
+def export_all(jobs, quality="h", workers=None):
+    """jobs: Liste von (datei, szene, {checkpoint: [pfade]}, env); ein Prozess je Job."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(export_stills, file, scene, stills, quality, env)
+                   for file, scene, stills, env in jobs]
+        for (file, scene, _, _), future in zip(jobs, futures):
+            missing = future.result()
+            if missing:
+                print(f"{file}:{scene}: Checkpoints nicht gefunden: {', '.join(missing)}")
+
+
+def checkpoint_jobs(specs, formats, out_dir=STILLS_DIR):
+    """"datei.py:Szene:checkpoint[,checkpoint]" -> ein Job je Szene."""
+    jobs = {}
+    for spec in specs:
+        file, scene, names = spec.split(":")
+        stills = jobs.setdefault((file, scene), {})
+        for name in names.split(","):
+            stills[name] = [out_dir / scene / f"{name}.{ext}" for ext in formats]
+    return [(file, scene, stills, None) for (file, scene), stills in jobs.items()]
+
+
+def aufgaben_jobs(tasks, formats, out_dir=STILLS_DIR / "aufgaben"):
+    """Je Aufgabe ein Job für VektorenAufgabe mit den Bildern "aufgabe" und "loesung"."""
+    jobs = []
+    for i in range(len(tasks["phi"])):
+        stills = {name: [out_dir / f"{i + 1:04d}_{name}.{ext}" for ext in formats] for name in ("aufgabe", "loesung")}
+        jobs.append(("vektoren.py", "VektorenAufgabe", stills, {TASK_ENV: task_env(tasks, i)}))
+    return jobs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("checkpoints", nargs="*", help="datei.py:Szene:checkpoint[,checkpoint]")
+    parser.add_argument("--aufgaben", type=int, default=0, help="Anzahl Aufgabenvarianten (VektorenAufgabe)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stufe", choices=STUFEN, default="schwer")
+    parser.add_argument("--pdf", action="store_true", help="zusätzlich PDF")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    formats = ["png", "pdf"] if args.pdf else ["png"]
+    jobs = checkpoint_jobs(args.checkpoints, formats)
+    if args.aufgaben:
+        jobs += aufgaben_jobs(generate_tasks(args.aufgaben, seed=args.seed, **STUFEN[args.stufe]), formats)
+    export_all(jobs, args.quality, args.workers)
+    print(f"{len(jobs)} Szenen -> {STILLS_DIR}")
@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Dot, ValueTracker  # noqa: E402
+
+from abhaengigkeiten import updating_mobjects, when_changed  # noqa: E402
+
+
+def follower(tracker):
+    dot = Dot()
+    dot.add_updater(when_changed(lambda m: m.set_x(tracker.get_value()), tracker))
+    dot.update()  # erster Lauf: Zustand gemerkt, nicht mehr dirty
+    return dot
+
+
+def test_tracker_in_scene_static_unless_animated():
+    tracker = ValueTracker(0)
+    dot = follower(tracker)
+    assert updating_mobjects([tracker, dot], []) == set()
+    assert id(dot) in updating_mobjects([tracker, dot], [tracker])
+
+
+def test_tracker_outside_scene_counts_as_moving():
+    tracker = ValueTracker(0)
+    dot = follower(tracker)
+    assert id(dot) in updating_mobjects([dot], [])
+
+
+def test_running_updater_makes_dependents_moving():
+    tracker = ValueTracker(0)
+    dot = follower(tracker)
+    setter = Dot().add_updater(lambda m: tracker.set_value(m.get_x()))
+    assert id(dot) in updating_mobjects([tracker, dot, setter], [])
+
+
+def test_directly_changed_tracker_is_dirty():
+    tracker = ValueTracker(0)
+    dot = follower(tracker)
+    tracker.set_value(1)
+    assert id(dot) in updating_mobjects([tracker, dot], [])
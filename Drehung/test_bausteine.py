@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import BLUE, GREEN, ManimColor  # noqa: E402
+
+from bausteine import MarkerCloud, _per_marker  # noqa: E402
+
+
+def test_per_marker_sequences():
+    assert _per_marker([0.5, 1.0, 0.2], 3) == [0.5, 1.0, 0.2]
+    assert _per_marker(np.array([1, 2, 3]), 3) == [1, 2, 3]
+    assert _per_marker(2, 3) == [2, 2, 2]
+    assert _per_marker(np.float64(2), 3) == [2, 2, 2]
+    # eine RGB-Farbe ist ein Wert, auch wenn N == 3
+    assert _per_marker((1.0, 0.0, 0.0), 3, color=True) == [(1.0, 0.0, 0.0)] * 3
+    assert _per_marker([BLUE, GREEN, BLUE], 3, color=True) == [BLUE, GREEN, BLUE]
+
+
+def test_per_marker_style():
+    cloud = MarkerCloud([[0, 0], [1, 0], [2, 0]], color=[BLUE, GREEN, GREEN], opacity=[1.0, 0.5, 0.5],
+                        stroke_width=[2, 4, 4])
+    assert cloud.n_markers == 3
+    assert len(cloud.submobjects) == 2
+    styles = [cloud.styles[s] for s in cloud.style_of]
+    assert [s[1:] for s in styles] == [(1.0, 2.0), (0.5, 4.0), (0.5, 4.0)]
+    assert styles[1][0].to_hex() == ManimColor(GREEN).to_hex()
+
+
+def test_copy_markers():
+    cloud = MarkerCloud([[0, 0], [1, 0], [2, 0], [3, 0]], color=[BLUE, BLUE, GREEN, GREEN],
+                        opacity=[1.0, 1.0, 0.5, 0.5], stroke_width=2)
+    copy = cloud.copy_markers([0, 2, 3])
+    assert copy.n_markers == 3
+    np.testing.assert_allclose(copy.get_positions(), cloud.get_positions()[[0, 2, 3]])
+
+    def style(c, s):
+        color, opacity, width = c.styles[s]
+        return color.to_hex(), opacity, width
+
+    assert [style(copy, s) for s in copy.style_of] == [style(cloud, s) for s in cloud.style_of[[0, 2, 3]]]
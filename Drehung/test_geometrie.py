@@ -0,0 +1,68 @@
+import numpy as np
+
+from geometrie import cos_sin, quarter_turns, rotate_points, rotation_from_pairs, rotational_symmetry
+
+
+def regular_polygon(n, radius=1.0, phase=0.3):
+    t = phase + 2 * np.pi * np.arange(n) / n
+    return np.stack([radius * np.cos(t), radius * np.sin(t)], axis=1)
+
+
+def test_quarter_turns_exact():
+    pts = np.array([[3.0, 2.0, 0.5], [-1.0, 4.0, 0.0]])
+    assert quarter_turns(np.pi / 2) == 1
+    assert quarter_turns(-np.pi / 2) == 3
+    assert quarter_turns(0.3) is None
+    assert quarter_turns(np.nan) is None
+    # bitgleich wie in VektorenV6: (x,y) -> (-y,x), (-x,-y), (y,-x)
+    assert np.array_equal(rotate_points(pts, np.pi / 2), [[-2.0, 3.0, 0.5], [-4.0, -1.0, 0.0]])
+    assert np.array_equal(rotate_points(pts, np.pi), [[-3.0, -2.0, 0.5], [1.0, -4.0, 0.0]])
+    assert np.array_equal(rotate_points(pts, -np.pi / 2, about=(1, 1, 0)), [[2.0, -1.0, 0.5], [4.0, 3.0, 0.0]])
+    c, s = cos_sin(np.radians(120))
+    assert (c, s) == (-0.5, np.sqrt(3) / 2)
+
+
+def test_rotate_points_out_aliasing():
+    rng = np.random.default_rng(1)
+    pts = rng.normal(size=(50, 3))
+    about = np.array([0.5, -1.0, 0.0])
+    for angle in (np.pi / 2, 0.7, rng.uniform(-3, 3, size=50)):
+        expected = rotate_points(pts, angle, about)
+        buf = pts.copy()
+        assert rotate_points(buf, angle, about, out=buf) is buf
+        np.testing.assert_allclose(buf, expected, atol=1e-12)
+
+
+def test_rotation_from_pairs():
+    tri = np.array([[1.0, 0.0], [3.0, 1.0], [2.0, 2.5]])
+    centre, angle = np.array([0.5, -0.3]), np.radians(75)
+    c, r, res = rotation_from_pairs(tri, rotate_points(tri, angle, centre))
+    np.testing.assert_allclose(c, centre, atol=1e-12)
+    assert np.isclose(r, angle) and res < 1e-12
+
+    # Spiegelung ist keine Drehung: deutlicher Restfehler
+    _, _, res = rotation_from_pairs(tri, tri * [1, -1])
+    assert res > 0.1
+
+    # Winkel 0 (Verschiebung): kein Zentrum
+    c, r, res = rotation_from_pairs(tri, tri + [1.0, 2.0])
+    assert np.all(np.isnan(c)) and r == 0
+
+
+def test_rotational_symmetry_orders():
+    rect = np.array([[-2, -1], [2, -1], [2, 1], [-2, 1]], dtype=float)
+    blade = np.array([[0.0, 0.0], [0.3, 1.0], [-0.2, 1.6]])
+    windmill = [rotate_points(blade, k * 2 * np.pi / 3) for k in range(3)]
+    cases = [(regular_polygon(4) + 2, 4), (rect, 2), (regular_polygon(6), 6), (windmill, 3), (blade, 1)]
+    for figure, order in cases:
+        assert rotational_symmetry(figure)[0] == order
+    _, centre, angle = rotational_symmetry(regular_polygon(4) + 2)
+    np.testing.assert_allclose(centre, [2, 2], atol=1e-12)
+    assert np.isclose(angle, np.pi / 2)
+
+
+def test_rotational_symmetry_closed_polygon():
+    square = np.array([[1, 1], [-1, 1], [-1, -1], [1, -1], [1, 1]], dtype=float)
+    order, centre, _ = rotational_symmetry(square)
+    assert order == 4
+    np.testing.assert_allclose(centre, [0, 0], atol=1e-12)
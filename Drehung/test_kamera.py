@@ -0,0 +1,32 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Camera, Circle, Dot, Square, VGroup  # noqa: E402
+
+from kamera import StaticLayerCamera  # noqa: E402
+
+
+def test_layer_family_not_drawn_twice(monkeypatch):
+    camera = StaticLayerCamera()
+    layer = VGroup(Square(), Circle())
+    other = Dot()
+    camera.set_static_layer(layer)
+
+    drawn = []  # (in den Ebenen-Puffer?, Mobjects) je Aufruf der Cairo-Kamera
+    capture = Camera.capture_mobjects
+
+    def spy(self, mobjects, **kwargs):
+        mobjects = list(mobjects)
+        drawn.append((self.pixel_array is self.layer_buffer, mobjects))
+        return capture(self, mobjects, **kwargs)
+
+    monkeypatch.setattr(Camera, "capture_mobjects", spy)
+    # flache Liste wie aus Scene.get_moving_mobjects: Ebene samt Teil-Mobjects, danach ein bewegtes Mobject
+    camera.capture_mobjects([layer, *layer.submobjects, other])
+
+    layer_family = {id(m) for m in layer.get_family()}
+    into_frame = [m for in_layer, mobjects in drawn if not in_layer for m in mobjects]
+    assert not layer_family & set(map(id, into_frame))
+    assert other in into_frame
+    assert [mobjects for in_layer, mobjects in drawn if in_layer] == [[layer]]
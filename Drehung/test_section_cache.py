@@ -0,0 +1,68 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import config  # noqa: E402
+
+from section_cache import code_regions  # noqa: E402
+
+
+class Original:
+    sections = ["a", "b"]
+
+    def construct(self):
+        config.background_color = "#0e0e0e"
+        prog = None
+        self.begin_section(prog, 0)
+        self.play("a")
+        self.begin_section(prog, 1)
+        self.play("b")
+
+
+class PrologueEdited:
+    sections = ["a", "b"]
+
+    def construct(self):
+        config.background_color = "#ffffff"
+        prog = None
+        self.begin_section(prog, 0)
+        self.play("a")
+        self.begin_section(prog, 1)
+        self.play("b")
+
+
+class SectionZeroEdited:
+    sections = ["a", "b"]
+
+    def construct(self):
+        config.background_color = "#0e0e0e"
+        prog = None
+        self.begin_section(prog, 0)
+        self.play("a2")
+        self.begin_section(prog, 1)
+        self.play("b")
+
+
+def test_prologue_invalidates_every_section():
+    before, after = code_regions(Original), code_regions(PrologueEdited)
+    assert before[0] != after[0]
+    assert before[1] != after[1]
+
+
+def test_section_edit_stays_local():
+    before, after = code_regions(Original), code_regions(SectionZeroEdited)
+    assert before[0] != after[0]
+    assert before[1] == after[1]
+
+
+def test_sections_without_begin_section_get_the_prologue():
+    class OnlyLast:
+        sections = ["a", "b", "c"]
+
+        def construct(self):
+            prog = None
+            self.begin_section(prog, 2)
+
+    regions = code_regions(OnlyLast)
+    assert set(regions) == {0, 1, 2}
+    assert "prog = None" in regions[0] and "begin_section" in regions[2]
@@ -0,0 +1,79 @@
+"""
+Übersetzt alle TeX-Formeln einer oder mehrerer Szenen vorab und parallel in den SVG-Cache.
+
+1. Trockenlauf von construct() ohne Rendern: jede TeX-Anfrage (Ausdruck, Umgebung,
+   Template) wird notiert und mit Platzhalter-Glyphen beantwortet - es läuft kein LaTeX.
+2. Alle gesammelten Formeln werden in einem Prozess-Pool übersetzt
+   (bereits vorhandene SVGs werden sofort übersprungen).
+
+Das eigentliche Rendern findet danach jede Formel im Cache (gemeinsames tex_dir, siehe manim.cfg).
+
+    python tex_prepass.py drehungen.py:DrehungenV5 vektoren.py:VektorenV6
+"""
+import argparse
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim import config, tempconfig
+from manim.utils.tex_file_writing import delete_nonsvg_files, tex_to_svg_file
+
+from entwurf import placeholder_svg
+from lektion import load_scene_class
+
+
+def collect_tex(file, scene):
+    """Trockenlauf der Szene; liefert {texcode: (Ausdruck, Umgebung, Template)}."""
+    requests = {}
+
+    def record(expression, environment=None, tex_template=None):
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        if environment:
+            key = tex_template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            key = tex_template.get_texcode_for_expression(expression)
+        # Template kopieren: Szenen erweitern die Präambel erst in construct()
+        requests.setdefault(key, (expression, environment, copy.deepcopy(tex_template)))
+        return placeholder_svg(expression, environment, tex_template)
+
+    scene_class = load_scene_class(file, scene)
+    original = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = record
+    try:
+        # tempconfig stellt auch config.tex_template wieder her
+        with tempconfig({"dry_run": True, "disable_caching": True}):
+            scene_class(skip_animations=True).render()
+    finally:
+        tex_mobject.tex_to_svg_file = original
+    return requests
+
+
+def compile_tex(request):
+    # kein Aufräumen während parallel übersetzt wird (delete_nonsvg_files löscht fremde .dvi)
+    config.no_latex_cleanup = True
+    expression, environment, tex_template = request
+    return tex_to_svg_file(expression, environment=environment, tex_template=tex_template)
+
+
+def compile_all(requests, workers=None):
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        svgs = list(pool.map(compile_tex, requests, chunksize=4))
+    delete_nonsvg_files()
+    return svgs
+
+
+def prepass(scenes, workers=None):
+    requests = {}
+    for spec in scenes:
+        requests.update(collect_tex(*spec.split(":")))
+    return compile_all(list(requests.values()), workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenes", nargs="+", help="datei.py:Szene")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    args = parser.parse_args()
+    print(f"{len(prepass(args.scenes, args.workers))} TeX-Formeln im Cache")
@@ -1,23 +1,15 @@
 from manim import *
-import numpy as np
-
-config.background_color = "#0e0e0e"
+import json
+import os
 
+import numpy as np
 
-def rotate_point(pt, angle, about=(0, 0, 0)):
-    pt = np.array(pt, dtype=float)
-    if pt.shape[0] == 2:
-        pt = np.array([pt[0], pt[1], 0.0])
-    about = np.array(about, dtype=float)
-    if about.shape[0] == 2:
-        about = np.array([about[0], about[1], 0.0])
+from aufgaben import TASK_ENV, fmt, solve
+from bausteine import cached_plane, cached_text
+from beschriftung import place_labels
+from lektion import LessonScene
 
-    v = pt - about
-    c, s = np.cos(angle), np.sin(angle)
-    R = np.array([[c, -s],
-                  [s, c]])
-    v2 = R @ v[:2]
-    return np.array([v2[0], v2[1], 0]) + about
+config.background_color = "#0e0e0e"
 
 
 class ProgressBar(VGroup):
@@ -32,8 +24,8 @@ class ProgressBar(VGroup):
         for i in range(n):
             x = -total_w / 2 + i * spacing
             circ = Circle(radius=0.22, stroke_width=2, color=GRAY).move_to([x, y, 0])
-            num = Text(str(i + 1), font_size=16).move_to(circ.get_center())
-            lbl = Text(sections[i], font_size=14, color=GRAY).next_to(circ, UP, buff=0.08)
+            num = cached_text(str(i + 1), font_size=16).move_to(circ.get_center())
+            lbl = cached_text(sections[i], font_size=14, color=GRAY).next_to(circ, UP, buff=0.08)
             self.add(circ, num, lbl)
             self.circles.add(circ)
             if i > 0:
@@ -54,19 +46,132 @@ class ProgressBar(VGroup):
             line.set_color(GREEN if i < idx else GRAY)
 
 
-class VektorenV6(Scene):
-    def construct(self):
-        def draw_vector(start, end, color):
-            return Arrow(start, end, buff=0, stroke_width=5, color=color)
+def draw_vector(start, end, color):
+    return Arrow(start, end, buff=0, stroke_width=5, color=color)
+
+
+# helper for mapping from math coords to NumberPlane points
+def ap(plane, xy):
+    x, y = xy
+    return plane.coords_to_point(x, y)
+
+
+def make_dot_at(plane, xy, color=WHITE):
+    return Cross(Dot(ap(plane, xy)), stroke_color=color, stroke_width=3)
+
+
+def tex_num(x):
+    return fmt(x).replace(",", "{,}")
+
 
-        # helper for mapping from math coords to NumberPlane points
-        def ap(plane, xy):
-            x, y = xy
-            return plane.coords_to_point(x, y)
+def pmatrix(v):
+    return r"\begin{pmatrix}" + tex_num(v[0]) + r"\\" + tex_num(v[1]) + r"\end{pmatrix}"
 
-        def make_dot_at(plane, xy, color=WHITE):
-            return Cross(Dot(ap(plane, xy)), stroke_color=color, stroke_width=3)
 
+def point_label(name, xy):
+    return f"{name} ({tex_num(xy[0])}|{tex_num(xy[1])})"
+
+
+def show_calculation(scene, plane, Z_coords, P_coords, phi_deg):
+    """Teil 4: P' = OZ + R(φ)·ZP für beliebige Z, P und φ (Grad) vorrechnen."""
+    ZP, ZPp, Pp = (v[0] for v in solve([Z_coords], [P_coords], [phi_deg]))
+
+    Z = make_dot_at(plane, Z_coords, color=YELLOW)
+    P = make_dot_at(plane, P_coords, color=BLUE)
+    Z_label = MathTex(point_label("Z", Z_coords))
+    P_label = MathTex(point_label("P", P_coords))
+    # bei generierten Aufgaben können Z und P nah beieinander liegen
+    place_labels([Z_label, P_label], [Z, P], prefer=[DOWN, UR])
+    scene.play(FadeIn(Z, P), Write(Z_label), Write(P_label))
+    scene.checkpoint("aufgabe")
+    scene.wait(0.5)
+
+    vZP = draw_vector(Z.get_center(), P.get_center(), BLUE)
+    vZP_label = MathTex(r"\vec{ZP} = " + pmatrix(ZP)).next_to(vZP, UR, buff=0.06)
+    scene.play(FadeOut(Z_label, P_label), Create(vZP), Write(vZP_label), run_time=0.5)
+    scene.wait(0.5)
+
+    vZP_copy = vZP.copy()
+    P_copy = P.copy()
+    rotGroup = VGroup(vZP_copy, P_copy)
+    scene.play(Rotate(rotGroup, phi_deg * DEGREES, about_point=Z.get_center()))
+    scene.play(FadeToColor(vZP_copy, GREEN),
+               FadeToColor(P_copy, GREEN))
+    scene.wait(0.5)
+    vZPp_label = MathTex(r"\vec{ZP'} = " + pmatrix(ZPp)).next_to(vZP_copy.get_center() + LEFT / 3, LEFT, buff=0.06)
+
+    scene.play(TransformFromCopy(vZP_label, vZPp_label))
+    scene.wait(0.5)
+
+    P_copy_label = MathTex("P'=?")
+    place_labels([P_copy_label], [P_copy], obstacles=[vZP_copy, vZPp_label, Z], prefer=[UL])
+    scene.play(Write(P_copy_label))
+    scene.wait(0.5)
+    vOPp = draw_vector(ap(plane, (0, 0)), P_copy.get_center(), RED)
+    vOPp_label = MathTex(r"\vec{OP'}", color=RED).next_to(vOPp.get_center(), UR, buff=0.05)
+    if np.any(Z_coords):
+        vOZ = draw_vector(ap(plane, (0, 0)), Z.get_center(), YELLOW)
+    else:  # Z = O: kein Ortsvektor
+        vOZ = VectorizedPoint(Z.get_center())
+    scene.play(FadeIn(vOPp), Write(vOPp_label), FadeIn(vOZ))
+    scene.wait(0.5)
+    scene.play(Indicate(vOPp, scale_factor=1.2, color=RED), run_time=0.5)
+    scene.wait(0.5)
+    scene.play(Indicate(vOZ, scale_factor=1.2, color=YELLOW), Indicate(vZP_copy, scale_factor=1.5, color=GREEN),
+               run_time=0.5)
+    scene.wait(0.5)
+
+    # irrelevante teile auslbenden
+    irrelevantGrp = VGroup(vOPp, vOPp_label, vZP, vZP_label, P)
+    scene.play(irrelevantGrp.animate.fade(0.7))
+
+    # Now the formula. We'll substitute visually.
+    # Einzelteile der Formel
+    L1_left = MathTex(r"\vec{OP'} = ")
+    oz_symbol = MathTex(r"\vec{OZ}")
+    plus = MathTex(r"+")
+    zp_symbol = MathTex(r"\vec{ZP'}")
+
+    # Positionieren: alle nebeneinander setzen
+    L1_group = VGroup(L1_left, oz_symbol, plus, zp_symbol).arrange(RIGHT, buff=0.15).to_edge(DOWN)
+    scene.play(Write(L1_group))
+    scene.wait(0.5)
+
+    # show vOZ
+    vOZ_label = MathTex(r"\vec{OZ} = " + pmatrix(Z_coords), color=YELLOW).next_to(vOZ.get_center(),
+                                                                                  DOWN, buff=0.05)
+    scene.play(Write(vOZ_label))
+    scene.wait(0.5)
+
+    oz_value = MathTex(pmatrix(Z_coords)).scale(0.75).move_to(oz_symbol.get_center())
+    zp_value = MathTex(pmatrix(ZPp)).scale(0.75).move_to(zp_symbol.get_center())
+
+    # Animation: die Werte „fliegen“ in die Formel
+    scene.play(
+        Transform(oz_symbol, oz_value),
+        Transform(zp_symbol, zp_value)
+    )
+    scene.wait(0.5)
+
+    # compute final result
+    result = MathTex(r"=", pmatrix(Pp)).next_to(zp_symbol, RIGHT, buff=0.2)
+    scene.play(Write(result))
+    scene.wait(0.5)
+
+    # label P' on plane
+    label_pp = MathTex(point_label("P'", Pp))
+    place_labels([label_pp], [P_copy], obstacles=[vZP_copy, vZPp_label, vOZ_label, Z, L1_group, result],
+                 prefer=[UL])
+    scene.play(Transform(P_copy_label, label_pp))
+    scene.checkpoint("loesung")
+    scene.wait(2)
+
+
+class VektorenV6(LessonScene):
+    sections = ["180°", "90°", "-90°", "P' berechnen"]
+    keyframes = ["regel_180", "regel_90", "regel_minus_90", "loesung"]
+
+    def construct(self):
         def make_arrow_from_origin(plane, xy, color=BLUE):
             return Arrow(ap(plane, (0, 0)), ap(plane, xy), buff=0, color=color, stroke_width=5)
 
@@ -85,17 +190,14 @@ class VektorenV6(Scene):
             return line, num
 
         # progressbar and plain
-        prog = ProgressBar(["180°", "90°", "-90°", "P' berechnen"])
+        prog = ProgressBar(self.sections)
         self.play(FadeIn(prog))
-        prog.set_progress(0)
-
-        plane = NumberPlane(
-            x_range=[-6, 6, 1],
-            y_range=[-3, 4, 1],
-            background_line_style={"stroke_color": GREY, "stroke_width": 1, "stroke_opacity": 0.35},
-            axis_config={"stroke_color": GREY_B, "stroke_width": 2, "stroke_opacity": 0.8, "include_tip": True},
-        ).add_coordinates(font_size=20, stroke_width=1, num_decimal_places=0).scale(0.95)
+        self.begin_section(prog, 0)
+        self.set_static_layer(prog)
+
+        plane = cached_plane()
         self.play(Create(plane))
+        self.set_static_layer(prog, plane)
 
         # ---------------- PART 1: 180° ----------------
         # Points
@@ -141,6 +243,7 @@ class VektorenV6(Scene):
                            color=ORANGE).scale(
             1).move_to(DOWN * 3 + RIGHT * 3)
         self.play(Write(rule_180))
+        self.checkpoint("regel_180")
         self.wait(0.5)
 
         # cleanup
@@ -150,7 +253,7 @@ class VektorenV6(Scene):
         self.wait(0.5)
 
         # ---------------- PART 2: +90° ----------------
-        prog.set_progress(1)
+        self.begin_section(prog, 1)
         P_coords = (3, 2)
         vZP = make_arrow_from_origin(plane, P_coords, color=BLUE)
         vZP_label = MathTex(r"\vec{ZP} = \begin{pmatrix}3\\2\end{pmatrix}").next_to(vZP, UR, buff=0.06)
@@ -180,6 +283,7 @@ class VektorenV6(Scene):
                           color=ORANGE).scale(
             1).move_to(DOWN * 3 + LEFT * 3)
         self.play(Write(rule_90))
+        self.checkpoint("regel_90")
         self.wait(0.5)
 
         self.wait(0.5)
@@ -189,7 +293,7 @@ class VektorenV6(Scene):
         self.wait(0.5)
 
         # ---------------- PART 3: -90° (same procedure) ----------------
-        prog.set_progress(2)
+        self.begin_section(prog, 2)
         P_coords = (3, 2)
         vZP = make_arrow_from_origin(plane, P_coords, color=BLUE)
         vZP_label = MathTex(r"\vec{ZP} = \begin{pmatrix}3\\2\end{pmatrix}").next_to(vZP, UR, buff=0.06)
@@ -217,6 +321,7 @@ class VektorenV6(Scene):
                           color=ORANGE).scale(
             1).move_to(DOWN * 3 + LEFT * 3)
         self.play(Write(rule_90))
+        self.checkpoint("regel_minus_90")
         self.wait(0.5)
 
         self.wait(0.5)
@@ -225,91 +330,25 @@ class VektorenV6(Scene):
                   run_time=0.5)
         self.wait(0.5)
 
-        # ---------------- PART 4: P' Berechnung (use your original layout style) ----------------
-        # Z = make_dot_at(plane, (0, 0), color=YELLOW)
-        # P_coords = (3, 2)
-        # P = make_dot_at(plane, P_coords, color=BLUE)
-        # Z_label = MathTex("Z").next_to(Z, UR, buff=0.06)
-
-        prog.set_progress(3)
-        Z = make_dot_at(plane, (-2, 0), color=YELLOW)
-        Z_label = MathTex("Z (-2|0)").next_to(Z, DOWN, buff=0.05)
-        P = make_dot_at(plane, (1, 2), color=BLUE)
-        P_label = MathTex("P (1|2)").next_to(P, UR, buff=0.05)
-        self.play(FadeIn(Z, P), Write(Z_label), Write(P_label))
-        self.wait(0.5)
+        # ---------------- PART 4: P' Berechnung ----------------
+        self.begin_section(prog, 3)
+        show_calculation(self, plane, (-2, 0), (1, 2), 90)
 
-        vZP = draw_vector(Z.get_center(), P.get_center(), BLUE)
-        vZP_label = MathTex(r"\vec{ZP} = \begin{pmatrix}3\\2\end{pmatrix}").next_to(vZP, UR, buff=0.06)
-        self.play(FadeOut(Z_label, P_label), Create(vZP), Write(vZP_label), run_time=0.5)
-        self.wait(0.5)
-
-        vZP_copy = vZP.copy()
-        P_copy = P.copy()
-        rotGroup = VGroup(vZP_copy, P_copy)
-        self.play(Rotate(rotGroup, PI / 2, about_point=Z.get_center()))
-        self.play(FadeToColor(vZP_copy, GREEN),
-                  FadeToColor(P_copy, GREEN))
-        self.wait(0.5)
-        vZPp_label = MathTex(r"\vec{ZP'} = \begin{pmatrix}-2\\3\end{pmatrix}").next_to(vZP_copy.get_center() + LEFT / 3,
-                                                                                       LEFT,
-                                                                                       buff=0.06)
-
-        self.play(TransformFromCopy(vZP_label, vZPp_label))
-        self.wait(0.5)
-
-        P_copy_label = MathTex("P'=?").next_to(P_copy, UL, buff=0.05)
-        self.play(Write(P_copy_label))
-        self.wait(0.5)
-        vOPp = draw_vector(ap(plane, (0, 0)), P_copy.get_center(), RED)
-        vOPp_label = MathTex(r"\vec{OP'}", color=RED).next_to(vOPp.get_center(), UR, buff=0.05)
-        vOZ = draw_vector(ap(plane, (0, 0)), Z.get_center(), YELLOW)
-        self.play(FadeIn(vOPp), Write(vOPp_label), FadeIn(vOZ))
-        self.wait(0.5)
-        self.play(Indicate(vOPp, scale_factor=1.2, color=RED), run_time=0.5)
-        self.wait(0.5)
-        self.play(Indicate(vOZ, scale_factor=1.2, color=YELLOW), Indicate(vZP_copy, scale_factor=1.5, color=GREEN),
-                  run_time=0.5)
-        self.wait(0.5)
 
-        # irrelevante teile auslbenden
-        irrelevantGrp = VGroup(vOPp, vOPp_label, vZP, vZP_label, P)
-        self.play(irrelevantGrp.animate.fade(0.7))
+class VektorenAufgabe(LessonScene):
+    """
+    Teil 4 von VektorenV6 für eine generierte Aufgabe (siehe aufgaben.py), z.B.
+        AUFGABE='{"Z": [1, -1], "P": [3, 2], "phi": -90}' manim -ql vektoren.py VektorenAufgabe
+    """
+    sections = VektorenV6.sections
+    keyframes = ["aufgabe", "loesung"]
+    in_kurs = False  # nicht Teil des Kurses (render_kurs.py)
 
-        # Now the formula. We'll substitute visually.
-        # Einzelteile der Formel
-        L1_left = MathTex(r"\vec{OP'} = ")
-        oz_symbol = MathTex(r"\vec{OZ}")
-        plus = MathTex(r"+")
-        zp_symbol = MathTex(r"\vec{ZP'}")
-
-        # Positionieren: alle nebeneinander setzen
-        L1_group = VGroup(L1_left, oz_symbol, plus, zp_symbol).arrange(RIGHT, buff=0.15).to_edge(DOWN)
-        self.play(Write(L1_group))
-        self.wait(0.5)
-
-        # show vOZ
-        vOZ_label = MathTex(r"\vec{OZ} = \begin{pmatrix}-2\\0\end{pmatrix}", color=YELLOW).next_to(vOZ.get_center(),
-                                                                                                   DOWN, buff=0.05)
-        self.play(Write(vOZ_label))
-        self.wait(0.5)
-
-        oz_value = MathTex(r"\begin{pmatrix}-2\\0\end{pmatrix}").scale(0.75).move_to(oz_symbol.get_center())
-        zp_value = MathTex(r"\begin{pmatrix}-2\\3\end{pmatrix}").scale(0.75).move_to(zp_symbol.get_center())
-
-        # Animation: die Werte „fliegen“ in die Formel
-        self.play(
-            Transform(oz_symbol, oz_value),
-            Transform(zp_symbol, zp_value)
-        )
-        self.wait(0.5)
-
-        # compute final result
-        result = MathTex(r"=", r"\begin{pmatrix}-4\\3\end{pmatrix}").next_to(zp_symbol, RIGHT, buff=0.2)
-        self.play(Write(result))
-        self.wait(0.5)
-
-        # label P' on plane
-        label_pp = MathTex(r"P' (-4|3)").next_to(P_copy, UL, buff=0.05)
-        self.play(Transform(P_copy_label, label_pp))
-        self.wait(2)
+    def construct(self):
+        task = json.loads(os.environ.get(TASK_ENV, '{"Z": [-2, 0], "P": [1, 2], "phi": 90}'))
+        prog = ProgressBar(self.sections)
+        plane = cached_plane()
+        self.add(prog, plane)
+        self.set_static_layer(prog, plane)
+        self.begin_section(prog, 3)
+        show_calculation(self, plane, task["Z"], task["P"], task["phi"])